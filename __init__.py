@@ -4,12 +4,71 @@ r"""
 .. codeauthor:: Hugo Plombat - LUPM <hugo.plombat@umontpellier.fr> & Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu> & Maxime Tarrasse - IRAP <Maxime.Tarrasse@irap.omp.eu>
 
 Init file for the SED fitting parser library.
+
+.. note::
+
+    Submodules are imported lazily the first time one of their objects is accessed, so that only the parts of the library which are actually used are loaded.
 """
 
-from .filters    import Filter, FilterList
-from .sed        import LePhareSED, CigaleSED
-from .catalogues import LePhareCat, CigaleCat
-from .outputs    import LePhareOutput, CigaleOutput
-from .misc       import SEDcode, CleanMethod, MagType, TableFormat, TableType, TableUnit, YESNO, ANDOR, IMF
-from .misc       import cigaleModules as cigmod
-from .photometry import countToMag, MagTocount, countToFlux, FluxToCount
+from   importlib import import_module
+
+#: Public objects and the submodule they are defined in (None if the object is the submodule itself)
+_SUBMODULES = {'Filter'          : ('.filters',            'Filter'),
+               'FilterList'      : ('.filters',            'FilterList'),
+               'LePhareSED'      : ('.sed',                'LePhareSED'),
+               'CigaleSED'       : ('.sed',                'CigaleSED'),
+               'LePhareCat'      : ('.catalogues',         'LePhareCat'),
+               'CigaleCat'       : ('.catalogues',         'CigaleCat'),
+               'LePhareOutput'   : ('.outputs',            'LePhareOutput'),
+               'CigaleOutput'    : ('.outputs',            'CigaleOutput'),
+               'SEDcode'         : ('.misc',               'SEDcode'),
+               'CleanMethod'     : ('.misc',               'CleanMethod'),
+               'MagType'         : ('.misc',               'MagType'),
+               'TableFormat'     : ('.misc',               'TableFormat'),
+               'TableType'       : ('.misc',               'TableType'),
+               'TableUnit'       : ('.misc',               'TableUnit'),
+               'YESNO'           : ('.misc',               'YESNO'),
+               'ANDOR'           : ('.misc',               'ANDOR'),
+               'IMF'             : ('.misc',               'IMF'),
+               'cigmod'          : ('.misc.cigaleModules', None),
+               'maskBoundingBox' : ('.misc.misc',          'maskBoundingBox'),
+               'countToMag'      : ('.photometry',         'countToMag'),
+               'MagTocount'      : ('.photometry',         'MagTocount'),
+               'countToFlux'     : ('.photometry',         'countToFlux'),
+               'FluxToCount'     : ('.photometry',         'FluxToCount')
+              }
+
+#: Submodules which can also be accessed as attributes of the library
+_MODULES    = ('filters', 'sed', 'catalogues', 'outputs', 'photometry', 'coloredMessages', 'misc')
+
+__all__     = list(_SUBMODULES)
+
+def __getattr__(name: str):
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+
+    Import the submodule defining the requested object on first access and cache the object in the package namespace.
+
+    :param name: name of the object
+    :type name: :python:`str`
+
+    :raises AttributeError: if **name** is not a public object of the library
+    '''
+
+    if name in _MODULES:
+        return import_module(f'.{name}', __name__)
+
+    if name not in _SUBMODULES:
+        raise AttributeError(f'module {__name__} has no attribute {name}.')
+
+    modName, attr   = _SUBMODULES[name]
+    module          = import_module(modName, __name__)
+    value           = module if attr is None else getattr(module, attr)
+
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    r'''List the public objects of the library, including the ones which are not imported yet.'''
+
+    return sorted(set(globals()) | set(__all__) | set(_MODULES))
@@ -1,7 +1,11 @@
+import os
 import os.path           as     opath
-from   astropy.io        import fits
+import fitsio
+import numpy             as     np
 import SED
 
+from   concurrent.futures import ThreadPoolExecutor
+
 from   matplotlib        import rc
 import matplotlib        as     mpl
 import matplotlib.pyplot as     plt
@@ -14,31 +18,36 @@ bands      = ['435', '606', '775', '814', '850', '105', '125', '140', '160'] # B
 band_names = ['ACS_WFC.F435W', 'ACS_WFC.F606W', 'ACS_WFC.F775W',             # Names of the band for LePhare
               'ACS_WFC.F814W', 'ACS_WFC.F850LP', 'WFC3_IR.F105W',
               'WFC3_IR.F125W', 'WFC3_IR.F140W', 'WFC3_IR.F160W']
+dataDir    = opath.abspath(opath.join('..', '..', 'example', 'data'))        # Directory with the data files (resolved once)
+
+def _paths(gal, band):
+   r'''Return the absolute paths of the flux map, the flux map convolved by the PSF squared and the variance map of a band.'''
 
-dataFiles  = [] # Flux maps
-data2Files = [] # Flux maps convolved by the PSF squared
-varFiles   = [] # Variance maps
+   return f'{dataDir}/{gal}_{band}.fits', f'{dataDir}/{gal}_{band}_PSF2.fits', f'{dataDir}/{gal}_{band}_var.fits'
 
-for band in bands:
+def _read_cutout(file):
+   r'''Read the cutout of a FITS file within the bounding box as a (data, header) tuple. Only the required tiles are decompressed.'''
 
-   file    = opath.abspath(opath.join('..', '..', 'example', 'data', f'{galName}_{band}.fits'))
-   dataFiles.append(file)
+   with fitsio.FITS(file) as hdul:
+      return hdul[0][ymin:ymax, xmin:xmax], hdul[0].read_header()
 
-   file2   = opath.abspath(opath.join('..', '..', 'example', 'data', f'{galName}_{band}_PSF2.fits'))
-   data2Files.append(file2)
+def _load_filter(band, zpt):
+   r'''Load the flux map, the flux map convolved by the PSF squared and the variance map cutouts of a band and build the corresponding Filter.'''
 
-   vfile   = opath.abspath(opath.join('..', '..', 'example', 'data', f'{galName}_{band}_var.fits'))
-   varFiles.append(vfile)
+   data, data2, var = (_read_cutout(f) for f in _paths(galName, band))
+   return SED.Filter(band, data, data2, var, zpt, bbox=bbox)
 
-# Get mask file
-mfile      = opath.abspath(opath.join('..', '..', 'example', 'data', f'{galName}_mask.fits'))
-with fits.open(mfile) as hdul:
-   mask    = hdul[0].data == 0
+# Get mask file and the bounding box of the galaxy
+mfile      = f'{dataDir}/{galName}_mask.fits'
+mask       = fitsio.read(mfile) == 0
+bbox       = SED.maskBoundingBox(mask)
+ymin, ymax, xmin, xmax = bbox
 
 ###   1. Generate a FilterList object   ###
-filts      = []
-for band, data, data2, var, zpt in zip(bands, dataFiles, data2Files, varFiles, zeropoints):
-   filts.append(SED.Filter(band, data, data2, var, zpt))
+
+# Filters are built in parallel (one thread per band, FITS reading and NumPy release the GIL)
+with ThreadPoolExecutor(max_workers=len(bands)) as ex:
+   filts   = list(ex.map(_load_filter, bands, zeropoints))
 
 flist      = SED.FilterList(filts, mask, code=SED.SEDcode.LEPHARE, redshift=redshift)
 
@@ -51,12 +60,22 @@ output.link(flist)
 mass_star  = output.toImage('mass_med')
 
 ###   7. Plot   ###
+# LaTeX rendering is slow, so it is only used when SED_USETEX=1 (e.g. for publication figures), mathtext is used otherwise
+usetex     = os.environ.get('SED_USETEX') == '1'
+
 rc('font', **{'family': 'serif', 'serif': ['Times']})
-rc('text', usetex=True)
-mpl.rcParams['text.latex.preamble'] = r'\usepackage{newtxmath}'
+rc('text', usetex=usetex)
 rc('figure', figsize=(5, 4.5))
 
-ret = plt.imshow(mass_star.data, origin='lower', cmap='rainbow')
+if usetex:
+   mpl.rcParams['text.latex.preamble'] = r'\usepackage{newtxmath}'
+else:
+   mpl.rcParams['mathtext.fontset']    = 'cm'
+
+# Single precision image without resampling (one screen pixel per map pixel is enough for a mass map)
+image      = mass_star.value.astype(np.float32)
+ret        = plt.imshow(image, origin='lower', cmap='rainbow', interpolation='nearest', resample=False,
+                        vmin=np.nanmin(image), vmax=np.nanmax(image))
 plt.xlabel('X [pixel]', size=13)
 plt.ylabel('Y [pixel]', size=13)
 
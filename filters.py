@@ -6,7 +6,10 @@ r"""
 Base classes used to generate resolved stellar and SFR maps with LePhare or Cigale SED fitting codes.
 """
 
+import os
 import os.path          as     opath
+import hashlib
+import inspect
 import numpy            as     np
 import astropy.io.fits  as     fits
 from   astropy.table    import Table
@@ -14,7 +17,7 @@ from   copy             import deepcopy
 from   functools        import partialmethod
 
 from   numpy            import ndarray
-from   typing           import Tuple, List, Union, Any, Optional
+from   typing           import Tuple, List, Union, Any, Optional, Callable
 
 from   .misc.enum       import SEDcode, CleanMethod, TableUnit, MagType, TableFormat, TableType
 from   .misc.misc       import ShapeError
@@ -36,12 +39,12 @@ class Filter:
     
     :param str filt: filter name
     :type filt: :python:`str`
-    :param file: data file name. File must exist and be a loadable FITS file.
-    :type file: :python:`str`
-    :param file2: file name for the data convolved by the square of the PSF. File must exist and be a loadable FITS file. If :python:`None`, no file is loaded and Poisson noise will not be added to the variance map.
-    :type file2: :python:`str`
-    :param errFile: error file name. File must exist and be a loadable FITS file. Error file is assumed to be the variance map.
-    :type errFile: :python:`str`
+    :param file: data file name. File must exist and be a loadable FITS file. Already loaded data can also be given as a (data, header) tuple.
+    :type file: :python:`str` or (`ndarray`_, `Astropy Header`_)
+    :param file2: file name for the data convolved by the square of the PSF. File must exist and be a loadable FITS file. Already loaded data can also be given as a (data, header) tuple. If :python:`None`, no file is loaded and Poisson noise will not be added to the variance map.
+    :type file2: :python:`str` or (`ndarray`_, `Astropy Header`_)
+    :param errFile: error file name. File must exist and be a loadable FITS file. Already loaded data can also be given as a (data, header) tuple. Error file is assumed to be the variance map.
+    :type errFile: :python:`str` or (`ndarray`_, `Astropy Header`_)
     :param float zeropoint: filter AB magnitude zeropoint
     :type zeropoint: :python:`float`
     
@@ -53,16 +56,31 @@ class Filter:
     :type extErr: :python:`int`
     :param bool verbose: (**Optional**) whether to print info messages or not
     :type verbose: :python:`bool`
+    :param memmap: (**Optional**) whether to memory map the FITS files when they are loaded with :python:`astropy.io.fits.open`. Only the pages of the pixels which are actually used are then read from disk. If :python:`None`, astropy default behaviour is used.
+    :type memmap: :python:`bool`
+    :param reader: (**Optional**) function used to load the FITS files. It is called as :python:`reader(file, ext=ext, header=True)` and must return a tuple (data, header), for instance :python:`fitsio.read` or :python:`astropy.io.fits.getdata`. If it accepts a **bbox** keyword argument, it is called as :python:`reader(file, ext=ext, header=True, bbox=bbox)` instead and must return the cutout within the bounding box. If :python:`None`, files are loaded with :python:`astropy.io.fits.open`.
+    :type reader: :python:`Callable`
+    :param bbox: (**Optional**) bounding box (ymin, ymax, xmin, xmax) of the cutout to load from the FITS files, upper bounds being excluded. If no reader is given, only the pixels (or the compressed tiles) within the box are read from disk. The same holds with a reader accepting a **bbox** keyword argument. With any other reader, the full images are read and cut out afterwards, so that the bounding box does not reduce I/O. Data given as (data, header) tuples are assumed to be already cut out. If :python:`None`, full images are loaded.
+    :type bbox: :python:`tuple[int]`
     
     :raises TypeError:
             
         * if **filt** is not of type :python:`str`
         * if **zeropoint** is neither :python:`int` nor :python:`float`
+        * if **reader** is neither :python:`None` nor a :python:`Callable`
+        * if **bbox** is neither :python:`None` nor a :python:`tuple` or :python:`list`
+        
+    :raises ValueError: if **bbox** does not have a length of 4
     '''
     
-    def __init__(self, filt: str, file: str, file2: Optional[str], errFile: str, zeropoint: float, 
+    def __init__(self, filt: str, 
+                 file: Union[str, Tuple[ndarray, Any]], 
+                 file2: Optional[Union[str, Tuple[ndarray, Any]]], 
+                 errFile: Union[str, Tuple[ndarray, Any]], 
+                 zeropoint: float, 
                  ext: int = 0, ext2: int = 0, extErr: int = 0,
-                 verbose: bool = True) -> None:
+                 verbose: bool = True, memmap: Optional[bool] = None, reader: Optional[Callable] = None,
+                 bbox: Optional[Tuple[int]] = None) -> None:
         r'''Initialise method.'''
         
         if not isinstance(filt, str):
@@ -71,12 +89,32 @@ class Filter:
         if not isinstance(zeropoint, (int, float)):
             raise TypeError(f'zeropoint parameter has type {type(zeropoint)} but it must be of type int or float.')
             
+        if reader is not None and not callable(reader):
+            raise TypeError(f'reader parameter has type {type(reader)} but it must be a callable object.')
+            
+        if bbox is not None:
+            
+            if not isinstance(bbox, (tuple, list)):
+                raise TypeError(f'bbox parameter has type {type(bbox)} but it must have type tuple or list.')
+            
+            if len(bbox) != 4:
+                raise ValueError(f'bbox parameter has length {len(bbox)} but it must have a length of 4.')
+            
+            bbox                  = tuple(int(i) for i in bbox)
+            
         self.verbose              = verbose
+        self.memmap               = memmap
+        self.reader               = reader
+        self.bbox                 = bbox
+        self._readerBbox          = reader is not None and self._acceptsBbox(reader)
         self.filter               = filt
         self.zpt                  = zeropoint
         self.fname                = file
         self.fname2               = file2
         self.ename                = errFile
+        self.ext                  = ext
+        self.ext2                 = ext2
+        self.extErr               = extErr
         
         self.hdr,  self.data      = self._loadFits(self.fname,  ext=ext)
         self.ehdr, self.var       = self._loadFits(self.ename,  ext=extErr)
@@ -124,12 +162,30 @@ class Filter:
         :rtype: `ndarray`_
         '''
         
-        # We make a deep copy to be sure we do not modify the input arrays
-        arr       = deepcopy(arr)
-        arr[mask] = np.nan
-        
-        return arr
+        # A new array is returned so that the input array is never modified (nor fully copied if it is memory mapped)
+        return np.where(mask, np.nan, arr)
             
+    @staticmethod
+    def _acceptsBbox(reader: Callable) -> bool:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Check whether a reader function accepts a **bbox** keyword argument.
+        
+        :param reader: reader function
+        :type reader: :python:`Callable`
+        
+        :returns: :python:`True` if the reader accepts a **bbox** keyword argument, :python:`False` otherwise (including when its signature cannot be inspected)
+        :rtype: :python:`bool`
+        '''
+        
+        try:
+            params = inspect.signature(reader).parameters
+        except (TypeError, ValueError):
+            return False
+        
+        return 'bbox' in params and params['bbox'].kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    
     def _checkFile(self, file: str, *args, **kwargs) -> bool:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
@@ -155,14 +211,22 @@ class Filter:
             return False
         return True
     
-    def _loadFits(self, file: str, ext: int = 0, **kwargs) -> Tuple[Any]:
+    def _loadFits(self, file: Union[str, Tuple[ndarray, Any]], ext: int = 0, **kwargs) -> Tuple[Any]:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
         Load data and header from a FITS file at the given extension.
+        
+        .. note::
+            
+            If a reader function was given at init, it is used instead of :python:`astropy.io.fits.open` to load the file.
+            
+            If **file** is a (data, header) tuple, the data are assumed to be already loaded and are returned as is.
+            
+            If a bounding box was given at init, only the corresponding cutout is returned. Without reader function, the cutout is read through the HDU section so that the full image is neither loaded nor decompressed. With a reader function, the bounding box is passed to the reader if it accepts a **bbox** keyword argument, otherwise the full image is read and cut out afterwards.
 
-        :param file: file name
-        :type file: :python:`str`
+        :param file: file name or (data, header) tuple
+        :type file: :python:`str` or (`ndarray`_, `Astropy Header`_)
         :param ext: (**Optional**) extension to load data from
         :type ext: :python:`str`
 
@@ -180,11 +244,36 @@ class Filter:
             raise TypeError(f'ext has type {type(ext)} but it must have type int.')
         elif ext < 0:
             raise ValueError(f'ext has value {ext} but it must be larger than or equal to 0.')
+            
+        # Data already loaded (e.g. prefetched in parallel by the user)
+        if isinstance(file, tuple):
+            data, hdr = file
+            return hdr, data
         
         if self._checkFile(file):
             try:
-                with fits.open(file) as hdul:
+                if self.reader is not None:
+                    
+                    # Readers accepting a bounding box only read the cutout, other ones read the full image which is cut out afterwards
+                    if self._readerBbox and self.bbox is not None:
+                        data, hdr = self.reader(file, ext=ext, header=True, bbox=self.bbox)
+                        return hdr, data
+                    
+                    data, hdr = self.reader(file, ext=ext, header=True)
+                    
+                    if self.bbox is not None:
+                        ymin, ymax, xmin, xmax = self.bbox
+                        data  = data[ymin:ymax, xmin:xmax]
+                    
+                    return hdr, data
+                
+                with fits.open(file, memmap=self.memmap) as hdul:
                     hdu = hdul[ext]
+                    
+                    if self.bbox is not None:
+                        ymin, ymax, xmin, xmax = self.bbox
+                        return hdu.header, hdu.section[ymin:ymax, xmin:xmax]
+                    
                     return hdu.header, hdu.data
                     
             # If an error is triggered, we always return None, None
@@ -204,7 +293,7 @@ class FilterList:
     
     :param filters: filters used to perform the SED fitting
     :type filters: :python:`list` [Filter]
-    :param mask: mask for bad pixels (:python:`True` for bad pixels, :python:`False` for good ones)
+    :param mask: mask for bad pixels (:python:`True` for bad pixels, :python:`False` for good ones). If the filters were loaded with a bounding box, the full frame mask can be given and it is cropped to the same bounding box.
     :type mask: `ndarray`_ [:python:`bool`]
     
     :param SEDcode code: (**Optional**) code used to perform the SED fitting. Either :py:attr:`~.SEDcode.LEPHARE` or :py:attr:`~.SEDcode.CIGALE` are accepted.
@@ -218,8 +307,17 @@ class FilterList:
         * if **filters** is not a :python:`list`
         * if **redshift** is neither an :python:`int` nor a :python:`float`
         * if one of the **filters** is not of type :py:class:`~.Filter`
+        
+    :raises ValueError: if the filters were not loaded with the same bounding box
     '''
     
+    #: Functions returning the value given to negative pixels for each cleaning method (resolved once per call to clean, never per pixel)
+    _cleanFills = {CleanMethod.ZERO : lambda data, negMask: 0,
+                   
+                   # Minimum is computed for each map independently (last two axes) so that cubes can also be cleaned
+                   CleanMethod.MIN  : lambda data, negMask: np.nanmin(np.where(negMask, np.nan, data), axis=(-2, -1), keepdims=True)
+                  }
+    
     def __init__(self, filters: List[Filter], mask: ndarray,
                  code: SEDcode = SEDcode.LEPHARE, redshift: Union[int, float] = 0, **kwargs) -> None:
         r'''Init method.'''
@@ -233,9 +331,6 @@ class FilterList:
         # :Redshift of the galaxy
         self.redshift = redshift
         
-        # :Define a mask which hides pixels
-        self.mask     = mask
-        
         # :Table used by SED fitting code (default is None)
         self.table    = None
         
@@ -254,6 +349,29 @@ class FilterList:
                     
         #: Data shape for easy access
         self.shape    = self.filters[0].data.shape
+        
+        #: Bounding box (ymin, ymax, xmin, xmax) of the filters cutouts within the full frame (None if full images are used)
+        self.bbox     = self.filters[0].bbox
+        
+        if any(f.bbox != self.bbox for f in self.filters[1:]):
+            raise ValueError('All the filters must be loaded with the same bounding box.')
+        
+        # A mask with the cutouts shape means that the cutouts are used as full frame images
+        if self.bbox is not None and np.shape(mask) == self.shape:
+            self.bbox = None
+        
+        #: Shape of the full frame images (same as shape if full images are used)
+        self.fullShape = np.shape(mask)
+        
+        # :Define a mask which hides pixels
+        if self.bbox is not None:
+            ymin, ymax, xmin, xmax = self.bbox
+            self.mask = mask[ymin:ymax, xmin:xmax]
+        else:
+            self.mask = mask
+            
+        # Flattened indices of the non masked pixels, computed once and used to only gather these pixels when building tables
+        self._flatIdx = np.flatnonzero(~np.asarray(self.mask, dtype=bool))
                     
         # Set SED fitting code. This rebuilds the table since SED fitting codes do not expect tables with the same columns
         self.setCode(code, **kwargs)
@@ -310,6 +428,110 @@ class FilterList:
                     raise ShapeError(f.data, self.filters[0], msg=' in filter list')
         
         return
+    
+    def _cleanAndNoiseCubes(self, cleanMethod: CleanMethod = CleanMethod.ZERO, texpFac: int = 0, **kwargs) -> Tuple[ndarray]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Gather the non masked pixels of the data and variance maps of all the filters into (filter, 1, pixel) cubes, clean them and add Poisson noise to the variance cube.
+        
+        .. note::
+            
+            Only non masked pixels are gathered so that masked pixels are never copied nor processed. They are stored as a single row image so that cubes can be passed to the methods working on (filter, y, x) cubes. Use :python:`self._flatIdx` to get the position of these pixels in the flattened filter images.
+            
+            Cleaning is performed on the whole cubes at once. Poisson noise is only added to the variance map of filters which have both an exposure time and data convolved by the PSF squared.
+            
+            Cubes are stored in single precision which is more than enough for photometric data and halves the memory used to build the tables.
+        
+        :param CleanMethod cleanMethod: (**Optional**) method used for the cleaning process
+        :param texpFac: (**Optional**) factor used to divide the exposition time
+        :type texpFac: :python:`int`
+        
+        :returns: cleaned data cube and cleaned variance cube with Poisson noise added, both with shape (filter, 1, pixel)
+        :rtype: (`ndarray`_, `ndarray`_)
+        '''
+        
+        idx              = self._flatIdx
+        data             = np.empty((len(self.filters), 1, idx.size), dtype=np.float32)
+        var              = np.empty_like(data)
+        
+        for pos, filt in enumerate(self.filters):
+            data[pos, 0] = filt.data.take(idx)
+            var[ pos, 0] = filt.var.take(idx)
+        
+        # Masked pixels were not gathered so that an empty mask is used
+        data, var        = self.clean(data, var, np.zeros(data.shape[-2:], dtype=bool), method=cleanMethod)
+        
+        # A null texpFac gives a null Poisson variance term so there is nothing to add
+        if texpFac == 0:
+            return data, var
+        
+        # Poisson variance of all the filters with an exposure time and data convolved by the PSF squared computed at once
+        noisy            = [pos for pos, filt in enumerate(self.filters) if filt.texp is not None and filt.data2 is not None]
+        
+        if len(noisy) > 0:
+            data2        = np.stack([self.filters[pos].data2.take(idx) for pos in noisy])
+            texp         = np.array([self.filters[pos].texp for pos in noisy])[:, np.newaxis]
+            var[noisy, 0] += self.poissonVar(data2, texp=texp, texpFac=texpFac)
+                
+        return data, var
+    
+    def _fullFrameIndices(self, indices: ndarray) -> ndarray:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Convert flattened pixel indices within the cutouts into flattened pixel indices within the full frame.
+        
+        :param indices: flattened indices in the cutouts
+        :type indices: `ndarray`_ [:python:`int`]
+        
+        :returns: flattened indices in the full frame
+        :rtype: `ndarray`_ [:python:`int`]
+        '''
+        
+        if self.bbox is None:
+            return indices
+        
+        ymin, _, xmin, _ = self.bbox
+        ys, xs           = np.unravel_index(indices, self.shape)
+        return np.ravel_multi_index((ys + ymin, xs + xmin), self.fullShape)
+    
+    def _cacheKey(self, cleanMethod: CleanMethod = CleanMethod.ZERO, scaleFactor: Union[int, float] = 100, texpFac: int = 0, **kwargs) -> str:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Compute a key identifying the table generated with the given parameters from the current filters and mask.
+        
+        .. note::
+            
+            Files are identified by their name, extension and modification time. Data which were not loaded from a file are identified by a hash of their content.
+        
+        :param CleanMethod cleanMethod: (**Optional**) method used for the cleaning process
+        :param scaleFactor: (**Optional**) factor used to multiply data and std map
+        :type scaleFactor: :python:`int` or :python:`float`
+        :param texpFac: (**Optional**) factor used to divide the exposition time
+        :type texpFac: :python:`int`
+        
+        :returns: hexadecimal key
+        :rtype: :python:`str`
+        '''
+        
+        items         = [self.code.value, cleanMethod.value, scaleFactor, texpFac, self.redshift, 
+                         hashlib.blake2b(np.ascontiguousarray(self.mask).tobytes()).hexdigest()]
+        
+        for filt in self.filters:
+            items.append((filt.filter, filt.zpt, filt.texp, filt.bbox))
+            
+            for name, ext, arr in zip([filt.fname, filt.fname2, filt.ename], [filt.ext, filt.ext2, filt.extErr], [filt.data, filt.data2, filt.var]):
+                
+                if isinstance(name, str):
+                    items.append((name, ext, os.stat(name).st_mtime_ns))
+                elif arr is not None:
+                    items.append(hashlib.blake2b(np.ascontiguousarray(arr).tobytes()).hexdigest())
+                else:
+                    items.append(None)
+        
+        return hashlib.blake2b(repr(items).encode()).hexdigest()
         
         
     ################################
@@ -413,48 +635,40 @@ class FilterList:
         # Compute mean map to scale data
         meanMap, _                 = self.computeMeanMap(maskVal=0)
         
-        dataList                   = []
-        stdList                    = []
-        for pos, filt in enumerate(self.filters):
-                  
-            # Clean and add noise to variance map
-            data, var              = self.cleanAndNoise(filt.data, filt.data2, filt.var, self.mask, cleanMethod=cleanMethod, texp=filt.texp, texpFac=texpFac)
-           
-            # Scale data to have compatible values with LePhare for the flux
-            data, var              = self.scale(data, var, meanMap, factor=scaleFactor)
-            
-            # Go to 1D version
-            if pos==0:
-                data, var, indices = self.arrayTo1D(data, var, indices=True)
-            else:
-                data, var          = self.arrayTo1D(data, var, indices=False)
-                
-            # 0 values are cast to NaN otherwise corresponding magnitude would be infinite
-            mask0                  = (np.asarray(data == 0) | np.asarray(var == 0))
-            data[mask0]            = np.nan
-            var[ mask0]            = np.nan
-            
-            # Compute std instead of variance and go to mag
-            data, std              = countToMag(data, np.sqrt(var), filt.zpt)
-            
-            # Cast back pixels with NaN values to -99 mag to specify they are not to be used in the SED fitting
-            data[mask0]            = -99
-            std[ mask0]            = -99
+        # Clean and add noise to the variance maps of all the filters at once
+        data, var                  = self._cleanAndNoiseCubes(cleanMethod=cleanMethod, texpFac=texpFac)
+        
+        # Scale data to have compatible values with LePhare for the flux (mean map is gathered at the same pixels as the cubes)
+        data, var                  = self.scale(data, var, meanMap.take(self._flatIdx)[np.newaxis], factor=scaleFactor)
+        
+        # Go to 1D version (one row per filter) with pixel indices given in the full frame
+        data, var, indices         = self.arrayTo1D(data, var, indices=True)
+        indices                    = self._fullFrameIndices(self._flatIdx[indices])
             
-            # Append data and std to list
-            dataList.append(data)
-            stdList.append( std)
+        # 0 values are cast to NaN otherwise corresponding magnitude would be infinite
+        mask0                      = (data == 0) | (var == 0)
+        data[mask0]                = np.nan
+        var[ mask0]                = np.nan
+        
+        # Compute std instead of variance and go to mag for all the filters at once (zeropoints are broadcast along the pixels)
+        std                        = np.sqrt(var)
+        zpts                       = np.array([filt.zpt for filt in self.filters])[:, np.newaxis]
+        data, std                  = countToMag(data, std, zpts)
+        
+        # Cast back pixels with NaN values to -99 mag to specify they are not to be used in the SED fitting
+        data[mask0]                = -99
+        std[ mask0]                = -99
             
         # Redshift column
         lf                         = len(self.filters)
-        ld                         = len(data)
+        ld                         = data.shape[1]
         zs                         = [self.redshift]*ld
         
         # Compute context (number of filters used - see LePhare documentation) and redshift columns
         context                    = [2**lf - 1]*ld
-        dtypes                     = [int]     + [float]*2*lf                                                       + [int, float]
+        dtypes                     = [int]     + [np.float32]*2*lf                                                  + [int, float]
         colnames                   = ['ID']    + [val for f in self.filters for val in [f.filter, f'e_{f.filter}']] + ['Context', 'zs']
-        columns                    = [indices] + [val for d, s in zip(dataList, stdList) for val in [d, s]]         + [ context, zs]
+        columns                    = [indices] + [val for d, s in zip(data, std) for val in [d, s]]                 + [ context, zs]
         
         return columns, colnames, dtypes
     
@@ -473,58 +687,77 @@ class FilterList:
         :rtype: (:python:`list[int/float/str], list[str], list[Any]`)
         '''
        
-        dataList                   = []
-        stdList                    = []
-        for pos, filt in enumerate(self.filters):
-
-            # Clean and add noise to variance map
-            data, var              = self.cleanAndNoise(filt.data, filt.data2, filt.var, self.mask, cleanMethod=cleanMethod, texp=filt.texp, texpFac=texpFac)
-            
-            # Go to 1D version
-            if pos==0:
-                data, var, indices = self.arrayTo1D(data, var, indices=True)
-            else:
-                data, var          = self.arrayTo1D(data, var, indices=False)
+        # Clean and add noise to the variance maps of all the filters at once
+        data, var                  = self._cleanAndNoiseCubes(cleanMethod=cleanMethod, texpFac=texpFac)
         
-            # Compute std and convert std and data to mJy unit
-            data, std              = [i.to('mJy').value for i in countToFlux(data, np.sqrt(var), filt.zpt)]
-            
-            # Append data and std to list
-            dataList.append(data)
-            stdList.append( std)
+        # Go to 1D version (one row per filter) with pixel indices given in the full frame
+        data, var, indices         = self.arrayTo1D(data, var, indices=True)
+        indices                    = self._fullFrameIndices(self._flatIdx[indices])
+        
+        # Compute std and convert std and data to mJy unit for all the filters at once (zeropoints are broadcast along the pixels)
+        std                        = np.sqrt(var)
+        zpts                       = np.array([filt.zpt for filt in self.filters])[:, np.newaxis]
+        data, std                  = [i.to('mJy').value for i in countToFlux(data, std, zpts)]
             
         # Redshift column
         ll                         = len(self.filters)
-        ld                         = len(data)
+        ld                         = data.shape[1]
         zs                         = [self.redshift]*ld
         
-        dtypes                     = [int, float]       + [float]*2*ll
+        dtypes                     = [int, float]       + [np.float32]*2*ll
         colnames                   = ['id', 'redshift'] + [val for f in self.filters for val in [f.filter, f'{f.filter}_err']]
-        columns                    = [indices, zs]      + [val for d, s in zip(dataList, stdList) for val in [d, s]]
+        columns                    = [indices, zs]      + [val for d, s in zip(data, std) for val in [d, s]]
         
         return columns, colnames, dtypes
         
     
-    def genTable(self, cleanMethod: CleanMethod = CleanMethod.ZERO, scaleFactor: Union[int, float] = 100, texpFac : int = 0, **kwargs) -> Table:
+    def genTable(self, cleanMethod: CleanMethod = CleanMethod.ZERO, scaleFactor: Union[int, float] = 100, texpFac : int = 0, 
+                 cacheDir: Optional[str] = None, **kwargs) -> Table:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
         Generate an input table for the SED fitting codes.
         
+        .. note::
+            
+            If **cacheDir** is provided, the table is saved as a FITS file in this directory and is loaded back instead of being recomputed when this method is called again with the same parameters and unchanged input files.
+        
         :param CleanMethod cleanMethod: (**Optional**) method used to clean pixel with negative values. Accepted values are :py:attr:`~.CleanMethod.ZERO` or :py:attr:`~.CleanMethod.MIN`.
         :param scaleFactor: (**Optional**) factor used to multiply data and std map. Only used if SED fitting code is LePhare.
         :type scaleFactor: :python:`int` or :python:`float`
         :param texpFac: (**Optional**) exposure factor used to divide the exposure time when computing Poisson noise. A value of :python:`0` means no Poisson noise is added to the variance map.
         :type texpFac: :python:`int`
+        :param cacheDir: (**Optional**) directory where generated tables are cached. If :python:`None`, no cache is used.
+        :type cacheDir: :python:`str`
         
         :returns: an output table
         :rtype: `Astropy Table`_
         
+        :raises TypeError: if **cacheDir** is neither :python:`None` nor a :python:`str`
         :raises ValueError: if there are no filters in the filter list
         '''
         
         if len(self.filters) < 1:
             raise ValueError('At least one filter must be in the filter list to build a table.')
+            
+        if cacheDir is not None:
+            
+            if not isinstance(cacheDir, str):
+                raise TypeError(f'cacheDir parameter has type {type(cacheDir)} but it must have type str.')
+            
+            cacheFile          = opath.join(opath.expanduser(opath.expandvars(cacheDir)), f'{self._cacheKey(cleanMethod=cleanMethod, scaleFactor=scaleFactor, texpFac=texpFac)}.fits')
+            
+            if opath.isfile(cacheFile):
+                
+                # Mean map and scale factor are still needed to build images from LePhare outputs
+                if self.code is SEDcode.LEPHARE:
+                    self.computeMeanMap(maskVal=0)
+                    self.scaleFac  = scaleFactor
+                
+                # NaN must stay NaN (not masked) and FITS big-endian columns are converted back to native byte order so that the table is the same as a freshly built one
+                table              = Table.read(cacheFile, mask_invalid=False)
+                self.table         = Table([np.asarray(table[name], dtype=table[name].dtype.newbyteorder('=')) for name in table.colnames], names=table.colnames)
+                return self.table
 
         if self.code is SEDcode.LEPHARE:
             col, names, dtypes = self._LePhareTableFactory(cleanMethod=cleanMethod, scaleFactor=scaleFactor, texpFac=texpFac)
@@ -534,6 +767,10 @@ class FilterList:
         # Generate the output Table
         self.table             = Table(col, names=names, dtype=dtypes)
         
+        if cacheDir is not None:
+            os.makedirs(opath.dirname(cacheFile), exist_ok=True)
+            self.table.write(cacheFile, overwrite=True)
+        
         return self.table
      
         
@@ -550,6 +787,8 @@ class FilterList:
             
             Provide indices = True to get the indices of the non-NaN pixels in the 1D array (brefore NaN are removed).
             
+            Data and variance cubes with shape (filter, y, x) can also be given. They are converted to arrays with shape (filter, pixel) and pixels which are NaN in at least one filter are removed.
+            
         :param data: data map
         :type data: `ndarray`_
         :param var: variance map
@@ -579,14 +818,17 @@ class FilterList:
         
         shp     = data.shape        
         
-        # Transform data and error maps into 1D vectors
-        data    = data.reshape(shp[0]*shp[1])
-        var     = var.reshape( shp[0]*shp[1])
+        # Transform data and error maps into 1D vectors (along the last two axes)
+        data    = data.reshape(*shp[:-2], shp[-2]*shp[-1])
+        var     = var.reshape( *shp[:-2], shp[-2]*shp[-1])
         
         # Get rid of NaN values
         nanMask = ~(np.isnan(data) | np.isnan(var))
-        data    = data[nanMask]
-        var     = var[ nanMask]
+        if nanMask.ndim > 1:
+            nanMask = nanMask.all(axis=0)
+            
+        data    = data[..., nanMask]
+        var     = var[ ..., nanMask]
         
         if indices:
             return data, var, np.where(nanMask)[0]
@@ -605,9 +847,11 @@ class FilterList:
             * If **method** is :py:attr:`~.CleanMethod.ZERO`, negative values in the data and error maps are set to 0
             * If **method** is :py:attr:`~.CleanMethod.MIN`, negative values in the data and error maps are set to the minimum value in the array
             
-        :param data: data map
+            Data and variance cubes with shape (filter, y, x) can also be given, in which case the mask is applied to each filter and the minimum value is computed for each filter independently.
+            
+        :param data: data map or cube
         :type data: `ndarray`_
-        :param var: variance map
+        :param var: variance map or cube
         :type var: `ndarray`_
         :param mask: mask used to apply NaN values
         :type mask: `ndarray`_ [:python:`bool`]
@@ -616,28 +860,29 @@ class FilterList:
         
         :returns: cleaned data and variance maps
         :rtype: (`ndarray`_, `ndarray`_)
+        
+        :raises TypeError: if **method** is not of type :py:class:`~.CleanMethod`
+        :raises ValueError: if **method** is not a supported cleaning method
         '''
         
         if not isinstance(method, CleanMethod):
             raise TypeError(f'method parameter has type {type(method)} but it must have type CleanMethod.')
+            
+        if method not in FilterList._cleanFills:
+            raise ValueError(f'method parameter has value {method} but only {list(FilterList._cleanFills)} are supported.')
         
-        # Deep copies to avoid to overwrite input arrays
-        data              = deepcopy(data)
-        var               = deepcopy(var)
-        
-        # Apply mask
-        data[mask]        = np.nan
-        var[ mask]        = np.nan
+        # Apply mask (new arrays are created so that input arrays are not overwritten)
+        data              = np.where(mask, np.nan, data)
+        var               = np.where(mask, np.nan, var)
         
         # Mask pixels having negative values
         negMask           = (data < 0) | (var < 0)
-        if method is CleanMethod.ZERO:
-            data[negMask] = 0
-            var[ negMask] = 0
-        elif method == CleanMethod.MIN:
-            mini          = np.nanmin(data[~negMask])
-            data[negMask] = mini
-            var[ negMask] = mini
+        
+        fill              = FilterList._cleanFills[method](data, negMask)
+            
+        # Replace negative values in place in a single pass (no fancy indexing nor temporary arrays)
+        np.copyto(data, fill, where=negMask)
+        np.copyto(var,  fill, where=negMask)
             
         return data, var
     
@@ -677,11 +922,34 @@ class FilterList:
         data, var = self.clean(data, var, mask, method=cleanMethod)
             
         # Add Poisson noise to the variance map
-        if texp is not None or data2 is None:
+        if texp is not None and data2 is not None:
             var  += self.poissonVar(data2, texp=texp, texpFac=texpFac)
         
         return data, var
     
+    def toFullFrame(self, arr: Optional[ndarray], fill: Union[int, float] = np.nan) -> Optional[ndarray]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Pad an array with the shape of the filters cutouts back to the full frame.
+        
+        :param arr: array with the cutouts shape. If :python:`None`, :python:`None` is returned.
+        :type arr: `ndarray`_
+        :param fill: (**Optional**) value given to pixels outside of the bounding box
+        :type fill: :python:`int` or :python:`float`
+        
+        :returns: array with the full frame shape
+        :rtype: `ndarray`_
+        '''
+        
+        if arr is None or self.bbox is None:
+            return arr
+        
+        ymin, ymax, xmin, xmax     = self.bbox
+        out                        = np.full(self.fullShape, fill, dtype=np.result_type(arr, fill))
+        out[ymin:ymax, xmin:xmax]  = arr
+        return out
+    
     def computeMeanMap(self, maskVal: Union[int, float] = 0, **kwargs) -> Tuple[ndarray]:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
@@ -720,7 +988,7 @@ class FilterList:
         return data, err
     
     @staticmethod
-    def poissonVar(data2: ndarray, texp: Union[int, float] = 1, texpFac: Union[int, float] = 1, **kwargs) -> ndarray:
+    def poissonVar(data2: ndarray, texp: Union[int, float, ndarray] = 1, texpFac: Union[int, float] = 1, **kwargs) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
@@ -740,25 +1008,33 @@ class FilterList:
         
         where :math:`\rm{TEXP}` is the exposure time and :math:`\rm{TEXPFAC}` is a coefficient used to scale it down.
         
+        .. note::
+            
+            No random realisation of the noise is drawn. Poisson noise only enters the variance map through this term so that generated tables are fully reproducible.
+        
         :param data2: square of flux map
         :type data2: `ndarray`_
         
-        :param texp: (**Optional**) exposure time in seconds
-        :type texp: :python:`int` or :python:`float`
+        :param texp: (**Optional**) exposure time in seconds. An array of exposure times broadcastable with **data2** can be given to compute the variance of several filters at once.
+        :type texp: :python:`int`, :python:`float` or `ndarray`_
         :param texpFac: (**Optional**) exposure factor
         :type texpFac: :python:`int` or :python:`float`
         
-        :raises TypeError: if **texp** or **texpFac** are not both :python:`int` or :python:`float`
+        :raises TypeError: 
+            
+            * if **texp** is neither an :python:`int`, a :python:`float` nor a `ndarray`_
+            * if **texpFac** is neither an :python:`int` nor a :python:`float`
+            
         :raises ValueError:
             
             * if :python:`texp <= 0`
             * if :python:`texpFac < 0`
         '''
         
-        if not all([isinstance(i, (int, float)) for i in [texp, texpFac]]):
-            raise TypeError(f'texp and texpFac parameters have types {type(texp)} and {type(texpFac)} but they must have type int or float.')
+        if not isinstance(texp, (int, float, ndarray)) or not isinstance(texpFac, (int, float)):
+            raise TypeError(f'texp and texpFac parameters have types {type(texp)} and {type(texpFac)} but they must have type int or float (texp can also be a ndarray).')
             
-        if texp <= 0:
+        if np.any(texp <= 0):
             raise ValueError(f'texp has value {texp} but it must be positive.')
             
         if texpFac < 0:
@@ -772,9 +1048,13 @@ class FilterList:
         
         Normalise given data and error maps using a norm map and scale by a certain amount. Necessary for LePhare SED fitting code.
         
-        :param data: data map
+        .. note::
+            
+            Data and variance cubes with shape (filter, y, x) can also be given. The same norm map is then applied to each filter.
+        
+        :param data: data map or cube
         :type data: `ndarray`_
-        :param var: variance map
+        :param var: variance map or cube
         :type var: `ndarray`_
         :param norm: normalisation map which divides data and error maps
         :type norm: `ndarray`_
@@ -785,19 +1065,19 @@ class FilterList:
         :returns: scaled data and variance maps
         :rtype: (`ndarray`_, `ndarray`_)
         
-        :raises ValueError: if **data** and **norm** do not have the same shapes
+        :raises ValueError: if **data** and **norm** do not have the same shapes (along the last two axes)
         '''
         
-        if norm.shape != data.shape:
-            raise ValueError(f'Incompatible norm and data shapes. norm map has shape {norm.shape} but data map has shape {self.data.shape}.')
+        if norm.shape != data.shape[-2:]:
+            raise ValueError(f'Incompatible norm and data shapes. norm map has shape {norm.shape} but data map has shape {data.shape}.')
         
         # Deep copies to avoid to overwrite input arrays
         d             = deepcopy(data)
         v             = deepcopy(var)
         
         mask          = norm != 0
-        d[mask]      *= factor/norm[mask]
-        v[mask]      *= (factor*factor/(norm[mask]*norm[mask])) # Variance normalisation is squared
+        d[..., mask] *= factor/norm[mask]
+        v[..., mask] *= (factor*factor/(norm[mask]*norm[mask])) # Variance normalisation is squared
         
         # Store scale factor for easy access
         self.scaleFac = factor
@@ -6,16 +6,322 @@ r"""
 Modules which can be used in Cigale.
 """
 
-from   abc           import ABC, abstractmethod
+import numpy         as     np
+from   numpy         import ndarray
+from   textwrap      import wrap
+from   sys           import intern
 from   .enum         import IMF
 from   .properties   import BoolProperty, PathProperty, StrProperty, EnumProperty, ListIntProperty, ListFloatProperty
-from   typing        import List, Any
+from   typing        import Any, Tuple, Optional, Iterator, Dict, Callable
+from   io            import TextIOBase
+from   functools     import lru_cache
+from   hashlib       import blake2b
+
+#: Metallicities accepted by the BC03 module
+_BC03_METALLICITIES  = np.array([0.0001, 0.0004, 0.004, 0.008, 0.02, 0.05])
+
+#: Metallicities accepted by the M2005 module
+_M2005_METALLICITIES = np.array([0.001, 0.01, 0.02, 0.04])
+
+#: Ionisation parameters accepted by the nebular module
+_LOGU_RANGE          = np.arange(-40, -9) / 10
+
+#: Factor converting an attenuation in mag into the natural logarithm of the transmission, i.e. 10**(-0.4 A) = exp(_MAG_TO_LN * A)
+_MAG_TO_LN           = -0.4 * np.log(10)
+
+def _optionTest(options: Any, decimals: Optional[int] = None) -> Callable[[ndarray], bool]:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Build the test function of a list property whose values must all be among a set of options.
+    
+    :param options: accepted values
+    :param decimals: (**Optional**) number of decimals the values are rounded to before checking them, so that floating point noise is accepted. If :python:`None`, values are not rounded.
+    :type decimals: :python:`int`
+    
+    :returns: a test function which returns :python:`True` (i.e. the test fails) if at least one value is not among the options
+    :rtype: :python:`Callable`
+    '''
+    
+    options = np.asarray(options)
+    
+    if decimals is None:
+        return lambda value: not np.isin(value, options).all()
+    
+    return lambda value: not np.isin(np.round(value, decimals), options).all()
+
+#############################
+#        Base module        #
+#############################
+
+class CigaleModule:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Base class of all the Cigale modules which builds and caches their string representation.
+    
+    Subclasses declare the section written in Cigale parameter files with the :python:`_SECTION` and :python:`_FIELDS` class attributes. The static parts of the text (section header, comments and parameter names) are built once from them when the subclass is defined, so that only the values are formatted when the text is built.
+    
+    .. note::
+        
+        The text is built once and stored on the instance. It is only built again if an attribute of the module is set or if the value of one of its own properties was set since it was stored, so that changes to other modules do not discard it. Modifying a property value in place (e.g. appending to its list) is not detected.
+    '''
+    
+    __slots__ = ('_text', '_textChanges')
+    
+    #: Name of the section in Cigale parameter files
+    _SECTION: str = ''
+    
+    #: Parameters of the section as (name, comment) pairs. The value of each parameter is the attribute with the same name.
+    _FIELDS: Tuple[Tuple[str, str], ...] = ()
+    
+    #: Properties built by :py:meth:`_setProperties` as name: (property class, keyword arguments of the property). Each property is built from the init parameter with the same name.
+    _PROPERTIES: Dict[str, Tuple[type, Dict[str, Any]]] = {}
+    
+    #: Interned static parts of the text written in Cigale parameter files. The value of a parameter goes between two consecutive parts.
+    _PARTS: Tuple[str, ...] = ('',)
+    
+    ##################################
+    #        Built-in methods        #
+    ##################################
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        r'''Build the static parts of the text of subclasses which declare their own section.'''
+        
+        super().__init_subclass__(**kwargs)
+        
+        if '_SECTION' in vars(cls):
+            cls._PARTS = cls._buildParts(cls._SECTION, cls._FIELDS)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Set an attribute and discard the cached text.
+        
+        :param name: name of the attribute
+        :type name: :python:`str`
+        :param value: new value of the attribute
+        '''
+        
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_text', None)
+        return
+    
+    def _changes(self) -> Tuple[int, ...]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Return how many times the value of each property of the module was set.
+        
+        :returns: one count per property of the module
+        :rtype: :python:`tuple` [:python:`int`]
+        '''
+        
+        return tuple(getattr(self, name).changes for name, _ in self._FIELDS)
+    
+    def __str__(self, *args, **kwargs) -> str:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Implement a string representation of the class used to make Cigale parameter files.
+        '''
+        
+        text = self._cachedText()
+        if text is None:
+            
+            changes = self._changes()
+            text    = ''.join(self._pieces())
+            
+            object.__setattr__(self, '_text',        text)
+            object.__setattr__(self, '_textChanges', changes)
+            
+        return text
+    
+    ###############################
+    #        Miscellaneous        #
+    ###############################
+    
+    def writeTo(self, f: TextIOBase) -> None:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Write the section of the module in Cigale parameter files to a file-like object. Unless the text is already cached, it is written piece by piece without building it in memory first.
+        
+        :param f: file-like object opened in text mode
+        :type f: :python:`TextIOBase`
+        '''
+        
+        text = self._cachedText()
+        if text is not None:
+            f.write(text)
+        else:
+            f.writelines(self._pieces())
+            
+        return
+    
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Hashable key made of the section name and of the values of its parameters. It identifies the text of the module and is much cheaper to hash and compare than the text, so it should be used to key caches of results per module configuration.
+        
+        .. note::
+            
+            The key is built again on each access, so that it always reflects the current values. Modules themselves are not hashable since they are mutable.
+        
+        :returns: the key
+        :rtype: :python:`tuple`
+        
+        :raises NotImplementedError: if the class does not declare a section
+        '''
+        
+        if not self._SECTION:
+            raise NotImplementedError(f'{type(self).__name__} does not declare a section of Cigale parameter files.')
+        
+        key = [self._SECTION]
+        for name, _ in self._FIELDS:
+            
+            value = getattr(self, name).value
+            if isinstance(value, ndarray):
+                value = tuple(value.tolist())
+            elif isinstance(value, list):
+                value = tuple(value)
+                
+            key.append(value)
+            
+        return tuple(key)
+    
+    def _setProperties(self, values: Dict[str, Any]) -> None:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Build the properties declared in :python:`_PROPERTIES` and set them as attributes.
+        
+        :param values: values of the properties, typically the :python:`locals()` of the init method
+        :type values: :python:`dict`
+        '''
+        
+        for name, (prop, kwargs) in self._PROPERTIES.items():
+            setattr(self, name, prop(values[name], **kwargs))
+            
+        return
+    
+    @staticmethod
+    def _grid(*properties) -> Tuple[ndarray, ...]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Build the grid of all the combinations of the values of list properties.
+        
+        :param properties: list properties to combine
+        
+        :returns: one column array per property with one row per combination, ordered as :python:`itertools.product` would
+        :rtype: :python:`tuple` [:python:`ndarray`]
+        '''
+        
+        grids = np.meshgrid(*[np.asarray(prop.value, dtype=float) for prop in properties], indexing='ij')
+        return tuple(grid.reshape(-1, 1) for grid in grids)
+    
+    def _cachedText(self) -> Optional[str]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Return the cached text if it is still up to date.
+        
+        :returns: the cached text or :python:`None` if it must be built again
+        :rtype: :python:`str` or :python:`None`
+        
+        :raises NotImplementedError: if the class does not declare a section
+        '''
+        
+        if not self._SECTION:
+            raise NotImplementedError(f'{type(self).__name__} does not declare a section of Cigale parameter files.')
+        
+        text = getattr(self, '_text', None)
+        if text is None or self._textChanges != self._changes():
+            return None
+        
+        return text
+    
+    def _pieces(self) -> Iterator[str]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Generate the pieces of the text in order, alternating the static parts and the values of the parameters.
+        
+        :returns: an iterator over the pieces
+        :rtype: :python:`Iterator[str]`
+        '''
+        
+        yield self._PARTS[0]
+        
+        for (name, _), part in zip(self._FIELDS, self._PARTS[1:]):
+            yield str(getattr(self, name))
+            yield part
+    
+    @property
+    def spec(self, *args, **kwargs) -> str:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Implement a string representation for the .spec file of Cigale parameters.
+        
+        :raises NotImplementedError: if the subclass does not implement it
+        '''
+        
+        raise NotImplementedError(f'{type(self).__name__} does not implement the spec property.')
+    
+    @staticmethod
+    def _buildParts(section: str, fields: Tuple[Tuple[str, str], ...]) -> Tuple[str, ...]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Build the static parts of a section of Cigale parameter files. Comments are wrapped the same way as in the files generated by Cigale.
+        
+        :param section: name of the section
+        :type section: :python:`str`
+        :param fields: parameters of the section as (name, comment) pairs
+        :type fields: :python:`tuple` [:python:`tuple` [:python:`str`, :python:`str`]]
+        
+        :returns: one more part than there are fields, the value of the i-th field going between the i-th and (i+1)-th parts
+        :rtype: :python:`tuple` [:python:`str`]
+        '''
+        
+        parts = []
+        lines = [f'        [[{section}]]']
+        for name, comment in fields:
+            
+            lines += wrap(comment, width=82, initial_indent='          # ', subsequent_indent='          # ')
+            lines.append(f'          {name} = ')
+            
+            parts.append('\n'.join(lines))
+            lines = ['']
+            
+        parts.append('\n'.join(lines) + '\n        ')
+        return tuple(map(intern, parts))
+
+def renderConfig(*modules: CigaleModule) -> str:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Render the sections of several modules in Cigale parameter files at once. This is the preferred way to build the configuration of several modules since the text is joined only once.
+    
+    :param modules: modules to render, in the order they must appear in the file
+    :type modules: :py:class:`CigaleModule`
+    
+    :returns: the sections of the modules separated by an empty line
+    :rtype: :python:`str`
+    '''
+    
+    return '\n\n'.join([str(module) for module in modules])
 
 ##########################################
 #        Star Formation Histories        #
 ##########################################
 
-class SFHmodule(ABC):
+class SFHmodule(CigaleModule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -25,33 +331,57 @@ class SFHmodule(ABC):
     :param bool normalise: (**Optional**) whether to normalise the SFH to produce one solar mass
     '''
     
+    __slots__ = ('name', 'normalise')
+    
     def __init__(self, name: Any, normalise: bool = True) -> None:
         r'''Init method.'''
         
         self.name      = name
         self.normalise = BoolProperty(normalise)
         
-    @abstractmethod
-    def __str__(self, *args, **kwargs) -> str:
+    @staticmethod
+    def _addBurst(main: ndarray, burst: ndarray, f_burst: ndarray) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation of the class used to make Cigale parameter files.
+        Add a burst to a main SFH so that the burst holds a fraction **f_burst** of the total mass formed.
+        
+        :param main: SFR of the main population, one row per combination
+        :type main: :python:`ndarray`
+        :param burst: SFR of the burst up to a normalisation factor, one row per combination
+        :type burst: :python:`ndarray`
+        :param f_burst: mass fraction of the burst as a column array
+        :type f_burst: :python:`ndarray`
+        
+        :returns: total SFR
+        :rtype: :python:`ndarray`
         '''
         
-        return
+        mMain  = main.sum( axis=-1, keepdims=True)
+        mBurst = burst.sum(axis=-1, keepdims=True)
+        scale  = np.divide(f_burst * mMain, (1 - f_burst) * mBurst, out=np.zeros_like(mBurst), where=mBurst > 0)
+        
+        return main + scale * burst
     
-    @property
-    @abstractmethod
-    def spec(self, *args, **kwargs) -> str:
+    def _normalised(self, sfr: ndarray) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation for the .spec file of Cigale parameters.
+        Normalise the SFR to form one solar mass if **normalise** is :python:`True`, assuming a time step of 1 Myr as in Cigale.
+        
+        :param sfr: SFR in M_sun/yr, one row per combination
+        :type sfr: :python:`ndarray`
+        
+        :returns: SFR modified in place
+        :rtype: :python:`ndarray`
         '''
         
-        return
-    
+        if self.normalise.value:
+            mass = sfr.sum(axis=-1, keepdims=True) * 1e6
+            np.divide(sfr, mass, out=sfr, where=mass > 0)
+            
+        return sfr
+        
 class SFH2EXPmodule(SFHmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
@@ -67,53 +397,66 @@ class SFH2EXPmodule(SFHmodule):
     :param bool normalise: (**Optional**) whether to normalise the SFH to produce one solar mass
     '''
     
-    def __init__(self, tau_main: List[int] = [6000], 
-                 tau_burst: List[int]      = [50],
-                 f_burst: List[float]      = [0.01], 
-                 age: List[int]            = [5000], 
-                 burst_age: List[int]      = [20], 
-                 sfr_0: List[float]        = [1.0],
+    __slots__ = ('tau_main', 'tau_burst', 'f_burst', 'age', 'burst_age', 'sfr_0')
+    
+    _SECTION = 'sfh2exp'
+    _FIELDS  = (('tau_main',  'e-folding time of the main stellar population model in Myr.'),
+                ('tau_burst', 'e-folding time of the late starburst population model in Myr.'),
+                ('f_burst',   'Mass fraction of the late burst population.'),
+                ('age',       'Age of the main stellar population in the galaxy in Myr. The precision is 1 Myr.'),
+                ('burst_age', 'Age of the late burst in Myr. The precision is 1 Myr.'),
+                ('sfr_0',     'Value of SFR at t = 0 in M_sun/yr.'),
+                ('normalise', 'Normalise the SFH to produce one solar mass.')
+               )
+    
+    _PROPERTIES = {'tau_main'  : (ListIntProperty,   dict(minBound=0)),
+                   'tau_burst' : (ListIntProperty,   dict(minBound=0)),
+                   'f_burst'   : (ListFloatProperty, dict(minBound=0.0, maxBound=0.9999)),
+                   'age'       : (ListIntProperty,   dict(minBound=0)),
+                   'burst_age' : (ListIntProperty,   dict(minBound=0)),
+                   'sfr_0'     : (ListFloatProperty, dict(minBound=0.0))
+                  }
+    
+    def __init__(self, tau_main: list[int] = [6000], 
+                 tau_burst: list[int]      = [50],
+                 f_burst: list[float]      = [0.01], 
+                 age: list[int]            = [5000], 
+                 burst_age: list[int]      = [20], 
+                 sfr_0: list[float]        = [1.0],
                  normalise: bool           = True) -> None:
         
         r'''Init method.'''
         
         super().__init__('sfh2exp', normalise=normalise)
         
-        self.tau_main  = ListIntProperty(  tau_main,  minBound=0)
-        self.tau_burst = ListIntProperty(  tau_burst, minBound=0)
-        self.f_burst   = ListFloatProperty(f_burst,   minBound=0.0, maxBound=0.9999)
-        self.age       = ListIntProperty(  age,       minBound=0)
-        self.burst_age = ListIntProperty(  burst_age, minBound=0)
-        self.sfr_0     = ListFloatProperty(sfr_0,     minBound=0.0)
+        self._setProperties(locals())
         
-    def __str__(self, *args, **kwargs) -> str:
+    def evaluate(self, t: ndarray) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
+        Compute the SFR at once for all the combinations of parameters.
         
-        text = f'''\
-        [[sfh2exp]]
-          # e-folding time of the main stellar population model in Myr.
-          tau_main = {self.tau_main}
-          # e-folding time of the late starburst population model in Myr.
-          tau_burst = {self.tau_burst}
-          # Mass fraction of the late burst population.
-          f_burst = {self.f_burst}
-          # Age of the main stellar population in the galaxy in Myr. The precision
-          # is 1 Myr.
-          age = {self.age}
-          # Age of the late burst in Myr. The precision is 1 Myr.
-          burst_age = {self.burst_age}
-          # Value of SFR at t = 0 in M_sun/yr.
-          sfr_0 = {self.sfr_0}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
+        :param t: time since the onset of star formation in Myr
+        :type t: :python:`ndarray`
+        
+        :returns: SFR in M_sun/yr with one row per combination of parameters (ordered as in :python:`itertools.product` over the parameters in the order of the init method) and one column per time
+        :rtype: :python:`ndarray`
         '''
         
-        return text
-    
+        tau_main, tau_burst, f_burst, age, burst_age, sfr_0 = self._grid(self.tau_main, self.tau_burst, self.f_burst, self.age, self.burst_age, self.sfr_0)
+        
+        t      = np.asarray(t, dtype=float)
+        alive  = t < age
+        
+        # Main population and late burst starting burst_age Myr before the end
+        main   = np.where(alive, sfr_0 * np.exp(-t / tau_main), 0.0)
+        tBurst = t - (age - burst_age)
+        burst  = np.where(alive & (tBurst >= 0), np.exp(-tBurst / tau_burst), 0.0)
+        sfr    = self._addBurst(main, burst, f_burst)
+        
+        return self._normalised(sfr)
+        
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -151,53 +494,65 @@ class SFHDELAYEDmodule(SFHmodule):
     :param bool normalise: (**Optional**) whether to normalise the SFH to produce one solar mass
     '''
     
-    def __init__(self, tau_main: List[int] = [2000], 
-                 age_main: List[int]       = [5000],
-                 tau_burst: List[int]      = [50],
-                 age_burst: List[int]      = [20], 
-                 f_burst: List[float]      = [0.0],  
-                 sfr_A: List[float]        = [1.0],
+    __slots__ = ('tau_main', 'age_main', 'tau_burst', 'age_burst', 'f_burst', 'sfr_A')
+    
+    _SECTION = 'sfhdelayed'
+    _FIELDS  = (('tau_main',  'e-folding time of the main stellar population model in Myr.'),
+                ('age_main',  'Age of the main stellar population in the galaxy in Myr. The precision is 1 Myr.'),
+                ('tau_burst', 'e-folding time of the late starburst population model in Myr.'),
+                ('age_burst', 'Age of the late burst in Myr. The precision is 1 Myr.'),
+                ('f_burst',   'Mass fraction of the late burst population.'),
+                ('sfr_A',     'Multiplicative factor controlling the SFR if normalise is False. For instance without any burst: SFR(t)=sfr_A×t×exp(-t/τ)/τ²'),
+                ('normalise', 'Normalise the SFH to produce one solar mass.')
+               )
+    
+    _PROPERTIES = {'tau_main'  : (ListIntProperty,   dict(minBound=0)),
+                   'age_main'  : (ListIntProperty,   dict(minBound=0)),
+                   'tau_burst' : (ListIntProperty,   dict(minBound=0)),
+                   'age_burst' : (ListIntProperty,   dict(minBound=0)),
+                   'f_burst'   : (ListFloatProperty, dict(minBound=0.0, maxBound=0.9999)),
+                   'sfr_A'     : (ListFloatProperty, dict(minBound=0.0))
+                  }
+    
+    def __init__(self, tau_main: list[int] = [2000], 
+                 age_main: list[int]       = [5000],
+                 tau_burst: list[int]      = [50],
+                 age_burst: list[int]      = [20], 
+                 f_burst: list[float]      = [0.0],  
+                 sfr_A: list[float]        = [1.0],
                  normalise: bool           = True) -> None:
         r'''Init method.'''
         
         super().__init__('sfhdelayed', normalise=normalise)
         
-        self.tau_main  = ListIntProperty(  tau_main,  minBound=0)
-        self.age_main  = ListIntProperty(  age_main,  minBound=0)
-        self.tau_burst = ListIntProperty(  tau_burst, minBound=0)
-        self.age_burst = ListIntProperty(  age_burst, minBound=0)
-        self.f_burst   = ListFloatProperty(f_burst,   minBound=0.0, maxBound=0.9999)
-        self.sfr_A     = ListFloatProperty(sfr_A,     minBound=0.0)
+        self._setProperties(locals())
         
-    def __str__(self, *args, **kwargs) -> str:
+    def evaluate(self, t: ndarray) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
+        Compute the SFR at once for all the combinations of parameters.
         
-        text = f'''\
-        [[sfhdelayed]]
-          # e-folding time of the main stellar population model in Myr.
-          tau_main = {self.tau_main}
-          # Age of the main stellar population in the galaxy in Myr. The precision
-          # is 1 Myr.
-          age_main = {self.age_main}
-          # e-folding time of the late starburst population model in Myr.
-          tau_burst = {self.tau_burst}
-          # Age of the late burst in Myr. The precision is 1 Myr.
-          age_burst = {self.age_burst}
-          # Mass fraction of the late burst population.
-          f_burst = {self.f_burst}
-          # Multiplicative factor controlling the SFR if normalise is False. For
-          # instance without any burst: SFR(t)=sfr_A×t×exp(-t/τ)/τ²
-          sfr_A = {self.sfr_A}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
+        :param t: time since the onset of star formation in Myr
+        :type t: :python:`ndarray`
+        
+        :returns: SFR in M_sun/yr with one row per combination of parameters (ordered as in :python:`itertools.product` over the parameters in the order of the init method) and one column per time
+        :rtype: :python:`ndarray`
         '''
         
-        return text
-    
+        tau_main, age_main, tau_burst, age_burst, f_burst, sfr_A = self._grid(self.tau_main, self.age_main, self.tau_burst, self.age_burst, self.f_burst, self.sfr_A)
+        
+        t      = np.asarray(t, dtype=float)
+        alive  = t < age_main
+        
+        # Delayed main population and late burst starting age_burst Myr before the end
+        main   = np.where(alive, sfr_A * t * np.exp(-t / tau_main) / tau_main**2, 0.0)
+        tBurst = t - (age_main - age_burst)
+        burst  = np.where(alive & (tBurst >= 0), np.exp(-tBurst / tau_burst), 0.0)
+        sfr    = self._addBurst(main, burst, f_burst)
+        
+        return self._normalised(sfr)
+        
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -234,50 +589,62 @@ class SFHDELAYEDBQmodule(SFHmodule):
     :param bool normalise: (**Optional**) whether to normalise the SFH to produce one solar mass
     '''
     
-    def __init__(self, tau_main: List[int] = [2000], 
-                 age_main: List[int]       = [5000],
-                 age_bq: List[int]         = [500],
-                 r_sfr: List[float]        = [0.1], 
-                 sfr_A: List[float]        = [1.0],
+    __slots__ = ('tau_main', 'age_main', 'age_bq', 'r_sfr', 'sfr_A')
+    
+    _SECTION = 'sfhdelayedbq'
+    _FIELDS  = (('tau_main',  'e-folding time of the main stellar population model in Myr.'),
+                ('age_main',  'Age of the main stellar population in the galaxy in Myr. The precision is 1 Myr.'),
+                ('age_bq',    'Age of the burst/quench episode. The precision is 1 Myr.'),
+                ('r_sfr',     'Ratio of the SFR after/before age_bq.'),
+                ('sfr_A',     'Multiplicative factor controlling the SFR if normalise is False. For instance without any burst/quench: SFR(t)=sfr_A×t×exp(-t/τ)/τ²'),
+                ('normalise', 'Normalise the SFH to produce one solar mass.')
+               )
+    
+    _PROPERTIES = {'tau_main' : (ListIntProperty,   dict(minBound=0)),
+                   'age_main' : (ListIntProperty,   dict(minBound=0)),
+                   'age_bq'   : (ListIntProperty,   dict(minBound=0)),
+                   'r_sfr'    : (ListFloatProperty, dict(minBound=0.0)),
+                   'sfr_A'    : (ListFloatProperty, dict(minBound=0.0))
+                  }
+    
+    def __init__(self, tau_main: list[int] = [2000], 
+                 age_main: list[int]       = [5000],
+                 age_bq: list[int]         = [500],
+                 r_sfr: list[float]        = [0.1], 
+                 sfr_A: list[float]        = [1.0],
                  normalise: bool           = True) -> None:
         
         r'''Init method.'''
         
         super().__init__('sfhdelayedbq', normalise=normalise)
         
-        self.tau_main  = ListIntProperty(  tau_main,  minBound=0)
-        self.age_main  = ListIntProperty(  age_main,  minBound=0)
-        self.age_bq    = ListIntProperty(  age_bq,    minBound=0)
-        self.r_sfr     = ListFloatProperty(r_sfr,     minBound=0.0)
-        self.sfr_A     = ListFloatProperty(sfr_A,     minBound=0.0)
+        self._setProperties(locals())
         
-    def __str__(self, *args, **kwargs) -> str:
+    def evaluate(self, t: ndarray) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
+        Compute the SFR at once for all the combinations of parameters.
         
-        text = f'''\
-        [[sfhdelayedbq]]
-          # e-folding time of the main stellar population model in Myr.
-          tau_main = {self.tau_main}
-          # Age of the main stellar population in the galaxy in Myr. The precision
-          # is 1 Myr.
-          age_main = {self.age_main}
-          # Age of the burst/quench episode. The precision is 1 Myr.
-          age_bq = {self.age_bq}
-          # Ratio of the SFR after/before age_bq.
-          r_sfr = {self.r_sfr}
-          # Multiplicative factor controlling the SFR if normalise is False. For
-          # instance without any burst/quench: SFR(t)=sfr_A×t×exp(-t/τ)/τ²
-          sfr_A = {self.sfr_A}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}    
+        :param t: time since the onset of star formation in Myr
+        :type t: :python:`ndarray`
+        
+        :returns: SFR in M_sun/yr with one row per combination of parameters (ordered as in :python:`itertools.product` over the parameters in the order of the init method) and one column per time
+        :rtype: :python:`ndarray`
         '''
         
-        return text
-
+        tau_main, age_main, age_bq, r_sfr, sfr_A = self._grid(self.tau_main, self.age_main, self.age_bq, self.r_sfr, self.sfr_A)
+        
+        t      = np.asarray(t, dtype=float)
+        
+        # Delayed SFH until the burst/quench episode, then constant at r_sfr times its last value
+        tBq    = age_main - age_bq
+        main   = sfr_A * t * np.exp(-t / tau_main) / tau_main**2
+        after  = r_sfr * sfr_A * tBq * np.exp(-tBq / tau_main) / tau_main**2
+        sfr    = np.where(t < tBq, main, np.where(t < age_main, after, 0.0))
+        
+        return self._normalised(sfr)
+        
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -311,43 +678,31 @@ class SFHFROMFILEmodule(SFHmodule):
     :param bool normalise: (**Optional**) whether to normalise the SFH to produce one solar mass
     '''
     
+    __slots__ = ('filename', 'sfr_column', 'age')
+    
+    _SECTION = 'sfhfromfile'
+    _FIELDS  = (('filename',   'Name of the file containing the SFH. The first column must be the time in Myr, starting from 0 with a step of 1 Myr. The other columns must contain the SFR in Msun/yr.[Msun/yr].'),
+                ('sfr_column', 'List of column indices of the SFR. The first SFR column has the index 1.'),
+                ('age',        'Age in Myr at which the SFH will be looked at.'),
+                ('normalise',  'Normalise the SFH to one solar mass produced at the given age.')
+               )
+    
+    _PROPERTIES = {'filename'   : (PathProperty,    dict()),
+                   'sfr_column' : (ListIntProperty, dict()),
+                   'age'        : (ListIntProperty, dict(minBound=0))
+                  }
+    
     def __init__(self, filename: str   = '',
-                 sfr_column: List[int] = [1],
-                 age: List[int]        = [1000],
+                 sfr_column: list[int] = [1],
+                 age: list[int]        = [1000],
                  normalise: bool       = True) -> None:
         
         r'''Init method.'''
         
         super().__init__('sfrfromfile', normalise=normalise)
         
-        self.filename   = PathProperty(filename)
-        self.sfr_column = ListIntProperty(sfr_column)
-        self.age        = ListIntProperty(age, minBound=0)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[sfhfromfile]]
-          # Name of the file containing the SFH. The first column must be the time
-          # in Myr, starting from 0 with a step of 1 Myr. The other columns must
-          # contain the SFR in Msun/yr.[Msun/yr].
-          filename = {self.filename}
-          # List of column indices of the SFR. The first SFR column has the index
-          # 1.
-          sfr_column = {self.sfr_column}
-          # Age in Myr at which the SFH will be looked at.
-          age = {self.age}
-          # Normalise the SFH to one solar mass produced at the given age.
-          normalise = {self.normalise}
-        '''
+        self._setProperties(locals())
         
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -375,58 +730,96 @@ class SFHPERIODICmodule(SFHmodule):
     
     :param list type_bursts: (**Optional**) type of the individual star formation episodes. 0: exponential, 1: delayed, 2: rectangle
     :param list delta_bursts: (**Optional**) elapsed time between the beginning of each burst in Myr
+    :param list tau_bursts: (**Optional**) duration (rectangle) or e-folding time of all short events in Myr. Must be at least 1.
     :param list age: (**Optional**) age of the main stellar population in the galaxy in Myr
     :param list sfr_A: (**Optional**) multiplicative factor controlling the amplitude of SFR (valid for each event)
     :param bool normalise: (**Optional**) whether to normalise the SFH to produce one solar mass
     '''
     
-    def __init__(self, type_bursts: List[int] = [0],
-                 delta_bursts: List[int]      = [50],
-                 tau_bursts: List[int]        = [20],
-                 age: List[int]               = [1000],
-                 sfr_A: List[float]           = [1.0],
+    __slots__ = ('type_bursts', 'delta_bursts', 'tau_bursts', 'age', 'sfr_A')
+    
+    _SECTION = 'sfhperiodic'
+    _FIELDS  = (('type_bursts',  'Type of the individual star formation episodes. 0: exponential, 1: delayed, 2: rectangle.'),
+                ('delta_bursts', 'Elapsed time between the beginning of each burst in Myr. The precision is 1 Myr.'),
+                ('tau_bursts',   'Duration (rectangle) or e-folding time of all short events in Myr. The precision is 1 Myr.'),
+                ('age',          'Age of the main stellar population in the galaxy in Myr. The precision is 1 Myr.'),
+                ('sfr_A',        'Multiplicative factor controlling the amplitude of SFR (valid for each event).'),
+                ('normalise',    'Normalise the SFH to produce one solar mass.')
+               )
+    
+    _PROPERTIES = {'type_bursts'  : (ListIntProperty,   dict(minBound=0, maxBound=2)),
+                   'delta_bursts' : (ListIntProperty,   dict(minBound=0)),
+                   'tau_bursts'   : (ListIntProperty,   dict(minBound=1)),
+                   'age'          : (ListIntProperty,   dict(minBound=0)),
+                   'sfr_A'        : (ListFloatProperty, dict(minBound=0.0))
+                  }
+    
+    def __init__(self, type_bursts: list[int] = [0],
+                 delta_bursts: list[int]      = [50],
+                 tau_bursts: list[int]        = [20],
+                 age: list[int]               = [1000],
+                 sfr_A: list[float]           = [1.0],
                  normalise: bool              = True) -> None:
         
         r'''Init method.'''
         
         super().__init__('sfhperiodic', normalise=normalise)
         
-        self.type_bursts  = ListIntProperty(  type_bursts,  minBound=0, maxBound=2)
-        self.delta_bursts = ListIntProperty(  delta_bursts, minBound=0)
-        self.tau_bursts   = ListIntProperty(  tau_bursts,   minBound=0)
-        self.age          = ListIntProperty(  age,          minBound=0)
-        self.sfr_A        = ListFloatProperty(sfr_A,        minBound=0.0)
+        self._setProperties(locals())
         
-    def __str__(self, *args, **kwargs) -> str:
+    def evaluate(self, t: ndarray) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
+        Compute the SFR at once for all the combinations of parameters.
         
-        text = f'''\
-        [[sfhperiodic]]
-          # Type of the individual star formation episodes. 0: exponential, 1:
-          # delayed, 2: rectangle.
-          type_bursts = {self.type_bursts}
-          # Elapsed time between the beginning of each burst in Myr. The precision
-          # is 1 Myr.
-          delta_bursts = {self.delta_bursts}
-          # Duration (rectangle) or e-folding time of all short events in Myr. The
-          # precision is 1 Myr.
-          tau_bursts = {self.tau_bursts}
-          # Age of the main stellar population in the galaxy in Myr. The precision
-          # is 1 Myr.
-          age = {self.age}
-          # Multiplicative factor controlling the amplitude of SFR (valid for each
-          # event).
-          sfr_A = {self.sfr_A}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
+        :param t: time since the onset of star formation in Myr
+        :type t: :python:`ndarray`
+        
+        :returns: SFR in M_sun/yr with one row per combination of parameters (ordered as in :python:`itertools.product` over the parameters in the order of the init method) and one column per time
+        :rtype: :python:`ndarray`
         '''
         
-        return text
-    
+        type_bursts, delta_bursts, tau_bursts, age, sfr_A = self._grid(self.type_bursts, self.delta_bursts, self.tau_bursts, self.age, self.sfr_A)
+        
+        t      = np.asarray(t, dtype=float)
+        
+        # Accumulate the bursts one at a time into a single output array rather than building a (combinations, times, bursts) array
+        nb     = int(np.ceil(np.max(age / np.maximum(delta_bursts, 1))))
+        sfr    = np.zeros(np.broadcast_shapes(age.shape, t.shape))
+        shape  = np.empty_like(sfr)
+        dt     = np.empty_like(sfr)
+        active = np.empty(sfr.shape, dtype=bool)
+        
+        # Masks and rates only depend on the parameters so they are computed once for all the bursts
+        isDel  = type_bursts == 1
+        isRect = type_bursts == 2
+        rate   = -1.0 / tau_bursts
+        rate2  = 1.0 / tau_bursts**2
+        
+        for k in range(nb):
+            
+            start = k * delta_bursts
+            np.subtract(t, start, out=dt)
+            
+            # Exponential and delayed bursts share the exponential factor, rectangle bursts are flat (values before the burst are masked below)
+            np.multiply(dt, rate, out=shape)
+            with np.errstate(over='ignore'):
+                np.exp(shape, out=shape)
+                np.multiply(shape, dt,    out=shape, where=isDel)
+                np.multiply(shape, rate2, out=shape, where=isDel)
+                
+            np.less(dt, tau_bursts, out=shape, where=isRect)
+            
+            np.greater_equal(dt, 0, out=active)
+            np.logical_and(active, start < age, out=active)
+            np.add(sfr, shape, out=sfr, where=active)
+            
+        sfr   *= sfr_A
+        sfr[t >= age] = 0.0
+        
+        return self._normalised(sfr)
+        
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -458,37 +851,28 @@ class SFH_BUATmodule(SFHmodule):
     :param bool normalise: (**Optional**) whether to normalise the SFH to produce one solar mass
     '''
     
-    def __init__(self, velocity: List[float] = [200.0],
-                 age: List[int]              = [5000],
+    __slots__ = ('velocity', 'age')
+    
+    _SECTION = 'sfh_buat08'
+    _FIELDS  = (('velocity',  'Rotational velocity of the galaxy in km/s. Must be between 40 and 360 (included).'),
+                ('age',       'Age of the oldest stars in the galaxy. The precision is 1 Myr.'),
+                ('normalise', 'Normalise the SFH to produce one solar mass.')
+               )
+    
+    _PROPERTIES = {'velocity' : (ListFloatProperty, dict(minBound=40.0, maxBound=360.0)),
+                   'age'      : (ListIntProperty,   dict(minBound=0))
+                  }
+    
+    def __init__(self, velocity: list[float] = [200.0],
+                 age: list[int]              = [5000],
                  normalise: bool             = True) -> None:
         
         r'''Init method.'''
         
         super().__init__('sfh_buat2008', normalise=normalise)
         
-        self.velocity = ListFloatProperty(velocity, minBound=40.0, maxBound=360.0)
-        self.age      = ListIntProperty(  age,      minBound=0)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[sfh_buat08]]
-          # Rotational velocity of the galaxy in km/s. Must be between 40 and 360
-          # (included).
-          velocity = {self.velocity}
-          # Age of the oldest stars in the galaxy. The precision is 1 Myr.
-          age = {self.age}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
-        '''
+        self._setProperties(locals())
         
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -517,47 +901,37 @@ class SFH_QUENCHING_SMOOTHmodule(SFHmodule):
     :param bool normalise: (**Optional**) whether to normalise the SFH to produce one solar mass
     '''
     
-    def __init__(self, quenching_time: List[int] = [0],
-                 quenching_factor: List[float]   = [0.0],
+    __slots__ = ('quenching_time', 'quenching_factor')
+    
+    _SECTION = 'sfh_quenching_smooth'
+    _FIELDS  = (('quenching_time',   'Look-back time when the quenching starts in Myr.'),
+                ('quenching_factor', 'Quenching factor applied to the SFH. After the quenching time, the SFR is multiplied by 1 - quenching factor and made constant. The factor must be between 0 (no quenching) and 1 (no more star formation).'),
+                ('normalise',        'Normalise the SFH to produce one solar mass.')
+               )
+    
+    _PROPERTIES = {'quenching_time'   : (ListIntProperty,   dict(minBound=0)),
+                   'quenching_factor' : (ListFloatProperty, dict(minBound=0.0, maxBound=1.0))
+                  }
+    
+    def __init__(self, quenching_time: list[int] = [0],
+                 quenching_factor: list[float]   = [0.0],
                  normalise: bool                 = True) -> None:
         
         r'''Init method.'''
         
         super().__init__('sfh_quenching_smooth', normalise=normalise)
         
-        self.quenching_time   = ListIntProperty(  quenching_time,   minBound=0)
-        self.quenching_factor = ListFloatProperty(quenching_factor, minBound=0.0, maxBound=1.0)
+        self._setProperties(locals())
         
-    def __str__(self, *args, **kwargs) -> str:
+    @property
+    def spec(self, *args, **kwargs) -> str:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation of the class used to make Cigale parameter files.
+        Implement a string representation for the .spec file of Cigale parameters.
         '''
         
-        text = f'''\
-        [[sfh_quenching_smooth]]
-          # Look-back time when the quenching starts in Myr.
-          quenching_time = {self.quenching_time}
-          # Quenching factor applied to the SFH. After the quenching time, the SFR
-          # is multiplied by 1 - quenching factor and made constant. The factor
-          # must be between 0 (no quenching) and 1 (no more star formation).
-          quenching_factor = {self.quenching_factor}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
-        '''
-        
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+        text = '''\
         [[sfh_quenching_smooth]]
           quenching_time = cigale_list(dtype=int, minvalue=0.)
           quenching_factor = cigale_list(minvalue=0., maxvalue=1.)
@@ -577,38 +951,28 @@ class SFH_QUENCHING_TRUNKmodule(SFHmodule):
     :param bool normalise: (**Optional**) whether to normalise the SFH to produce one solar mass
     '''
     
-    def __init__(self, quenching_age: List[int] = [0],
-                 quenching_factor: List[float]  = [0.0],
+    __slots__ = ('quenching_age', 'quenching_factor')
+    
+    _SECTION = 'sfh_quenching_trunk'
+    _FIELDS  = (('quenching_age',    'Look-back time when the quenching happens in Myr.'),
+                ('quenching_factor', 'Quenching factor applied to the SFH. After the quenching time, the SFR is multiplied by 1 - quenching factor and made constant. The factor must be between 0 (no quenching) and 1 (no more star formation).'),
+                ('normalise',        'Normalise the SFH to produce one solar mass.')
+               )
+    
+    _PROPERTIES = {'quenching_age'    : (ListIntProperty,   dict(minBound=0)),
+                   'quenching_factor' : (ListFloatProperty, dict(minBound=0.0, maxBound=1.0))
+                  }
+    
+    def __init__(self, quenching_age: list[int] = [0],
+                 quenching_factor: list[float]  = [0.0],
                  normalise: bool                = True) -> None:
         
         r'''Init method.'''
         
         super().__init__('sfh_quenching_smooth', normalise=normalise)
         
-        self.quenching_age    = ListIntProperty(  quenching_age,    minBound=0)
-        self.quenching_factor = ListFloatProperty(quenching_factor, minBound=0.0, maxBound=1.0)
+        self._setProperties(locals())
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[sfh_quenching_trunk]]
-          # Look-back time when the quenching happens in Myr.
-          quenching_age = {self.quenching_age}
-          # Quenching factor applied to the SFH. After the quenching time, the SFR
-          # is multiplied by 1 - quenching factor and made constant. The factor
-          # must be between 0 (no quenching) and 1 (no more star formation).
-          quenching_factor = {self.quenching_factor}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -630,7 +994,7 @@ class SFH_QUENCHING_TRUNKmodule(SFHmodule):
 #        Single Stellar Populations        #
 ############################################
 
-class SSPmodule(ABC):
+class SSPmodule(CigaleModule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -642,9 +1006,11 @@ class SSPmodule(ABC):
     :param list separation_age: (**Optional**) age [Myr] of the separation between the young and the old star populations. The default value in 10^7 years (10 Myr). Set to 0 not to differentiate ages (only an old population).
     '''
     
+    __slots__ = ('name', 'imf', 'separation_age')
+    
     def __init__(self, name: Any,
                  imf: IMF                  = IMF.SALPETER,
-                 separation_age: List[int] = [10]) -> None:
+                 separation_age: list[int] = [10]) -> None:
         
         r'''Init method.'''
         
@@ -652,27 +1018,6 @@ class SSPmodule(ABC):
         self.imf            = EnumProperty(imf)
         self.separation_age = ListIntProperty(separation_age, minBound=0)
         
-    @abstractmethod
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        return
-    
-    @property
-    @abstractmethod
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        return
-    
 class BC03module(SSPmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
@@ -684,40 +1029,26 @@ class BC03module(SSPmodule):
     :param list metallicity: (**Optional**) metallicity. Possible values are: 0.0001, 0.0004, 0.004, 0.008, 0.02, 0.05
     '''
     
+    __slots__ = ('metallicity',)
+    
+    _SECTION = 'bc03'
+    _FIELDS  = (('imf',            'Initial mass function: 0 (Salpeter) or 1 (Chabrier).'),
+                ('metallicity',    'Metalicity. Possible values are: 0.0001, 0.0004, 0.004, 0.008, 0.02, 0.05.'),
+                ('separation_age', 'Age [Myr] of the separation between the young and the old star populations. The default value in 10^7 years (10 Myr). Set to 0 not to differentiate ages (only an old population).')
+               )
+    
     def __init__(self, imf: IMF            = IMF.SALPETER,
-                 separation_age: List[int] = [10],
-                 metallicity: List[float]  = [0.02]) -> None:
+                 separation_age: list[int] = [10],
+                 metallicity: list[float]  = [0.02]) -> None:
         
         r'''Init method.'''
         
         super().__init__('bc03', imf=imf, separation_age=separation_age)
         
         self.metallicity = ListFloatProperty(metallicity, minBound=0.0001, maxBound=0.05, 
-                                             testFunc=lambda value: any((i not in [0.0001, 0.0004, 0.004, 0.008, 0.02, 0.05] for i in value)),
+                                             testFunc=_optionTest(_BC03_METALLICITIES),
                                              testMsg='Metallicity for bc03 module must be one of 0.0001, 0.0004, 0.004, 0.008, 0.02, 0.05.')
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[bc03]]
-          # Initial mass function: 0 (Salpeter) or 1 (Chabrier).
-          imf = {self.imf}
-          # Metalicity. Possible values are: 0.0001, 0.0004, 0.004, 0.008, 0.02,
-          # 0.05.
-          metallicity = {self.metallicity}
-          # Age [Myr] of the separation between the young and the old star
-          # populations. The default value in 10^7 years (10 Myr). Set to 0 not to
-          # differentiate ages (only an old population).
-          separation_age = {self.separation_age}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -750,39 +1081,26 @@ class M2005module(SSPmodule):
     :param list metallicity: (**Optional**) metallicity. Possible values are: 0.001, 0.01, 0.02, 0.04
     '''
     
+    __slots__ = ('metallicity',)
+    
+    _SECTION = 'm2005'
+    _FIELDS  = (('imf',            'Initial mass function: 0 (Salpeter) or 1 (Kroupa)'),
+                ('metallicity',    'Metallicity. Possible values are: 0.001, 0.01, 0.02, 0.04.'),
+                ('separation_age', 'Age [Myr] of the separation between the young and the old star populations. The default value in 10^7 years (10 Myr). Set to 0 not to differentiate ages (only an old population).')
+               )
+    
     def __init__(self, imf: IMF            = IMF.SALPETER,
-                 separation_age: List[int] = [10],
-                 metallicity: List[float]  = [0.02]) -> None:
+                 separation_age: list[int] = [10],
+                 metallicity: list[float]  = [0.02]) -> None:
         
         r'''Init method.'''
         
         super().__init__('m2005', imf=imf, separation_age=separation_age)
         
         self.metallicity = ListFloatProperty(metallicity, minBound=0.001, maxBound=0.04, 
-                                             testFunc=lambda value: any((i not in [0.001, 0.01, 0.02, 0.04] for i in value)),
+                                             testFunc=_optionTest(_M2005_METALLICITIES),
                                              testMsg='Metallicity for bc03 module must be one of 0.001, 0.01, 0.02, 0.04.')
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[m2005]]
-          # Initial mass function: 0 (Salpeter) or 1 (Kroupa)
-          imf = {self.imf}
-          # Metallicity. Possible values are: 0.001, 0.01, 0.02, 0.04.
-          metallicity = {self.metallicity}
-          # Age [Myr] of the separation between the young and the old star
-          # populations. The default value in 10^7 years (10 Myr). Set to 0 not to
-          # differentiate ages (only an old population).
-          separation_age = {self.separation_age}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -804,7 +1122,7 @@ class M2005module(SSPmodule):
 #        Nebular emission        #
 ##################################
 
-class NEBULARmodule:
+class NEBULARmodule(CigaleModule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -821,50 +1139,36 @@ class NEBULARmodule:
     :param bool include_emission: (**Optional**) whether to include the nebular emission or not
     '''
     
-    def __init__(self, logU: List[float]  = [-2.0],
-                 f_esc: List[float]       = [0.0],
-                 f_dust: List[float]      = [0.0],
-                 lines_width: List[float] = [300.0],
+    __slots__ = ('name', 'logU', 'f_esc', 'f_dust', 'lines_width', 'emission')
+    
+    _SECTION = 'nebular'
+    _FIELDS  = (('logU',        'Ionisation parameter'),
+                ('f_esc',       'Fraction of Lyman continuum photons escaping the galaxy'),
+                ('f_dust',      'Fraction of Lyman continuum photons absorbed by dust'),
+                ('lines_width', 'Line width in km/s'),
+                ('emission',    'Include nebular emission.')
+               )
+    
+    def __init__(self, logU: list[float]  = [-2.0],
+                 f_esc: list[float]       = [0.0],
+                 f_dust: list[float]      = [0.0],
+                 lines_width: list[float] = [300.0],
                  include_emission: bool   = True) -> None:
         
         r'''Init method.'''
         
         self.name        = 'nebular'
         
-        logURange        = [i/10 for i in range(-40, -9, 1)]
-        
+        # Values are rounded so that floating point noise (e.g. -2.3000000000000003) is accepted
         self.logU        = ListFloatProperty(logU, minBound=-4.0, maxBound=-1.0,
-                                             testFunc=lambda value: any((i not in logURange for i in value)),
-                                             testMsg=f'One on the logU values is not accepted. Accepted values must be in the list {logURange}')
+                                             testFunc=_optionTest(_LOGU_RANGE, decimals=6),
+                                             testMsg=f'One on the logU values is not accepted. Accepted values must be in the list {_LOGU_RANGE.tolist()}')
         
         self.f_esc       = ListFloatProperty(f_esc,       minBound=0, maxBound=1)
         self.f_dust      = ListFloatProperty(f_dust,      minBound=0, maxBound=1)
         self.lines_width = ListFloatProperty(lines_width, minBound=0)
         self.emission    = BoolProperty(include_emission)
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[nebular]]
-          # Ionisation parameter
-          logU = {self.logU}
-          # Fraction of Lyman continuum photons escaping the galaxy
-          f_esc = {self.f_esc}
-          # Fraction of Lyman continuum photons absorbed by dust
-          f_dust = {self.f_dust}
-          # Line width in km/s
-          lines_width = {self.lines_width}
-          # Include nebular emission.
-          emission = {self.emission}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -888,7 +1192,241 @@ class NEBULARmodule:
 #        Dust attenuation        #
 ##################################
 
-class ATTENUATIONmodule(ABC):
+def _kCalzetti(wavelength: ndarray) -> ndarray:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Calzetti et al. (2000) starburst attenuation curve k(λ) = A(λ) / E(B-V).
+    
+    :param wavelength: wavelengths in nm
+    :type wavelength: :python:`ndarray`
+    
+    :returns: attenuation curve
+    :rtype: :python:`ndarray`
+    '''
+    
+    return np.where(wavelength < 630,
+                    2.659 * (-2.156 + 1.509e3 / wavelength - 0.198e6 / wavelength**2 + 0.011e9 / wavelength**3) + 4.05,
+                    2.659 * (-1.857 + 1.040e3 / wavelength) + 4.05)
+
+def _kLeitherer(wavelength: ndarray) -> ndarray:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Leitherer et al. (2002) far UV attenuation curve k(λ) = A(λ) / E(B-V).
+    
+    :param wavelength: wavelengths in nm
+    :type wavelength: :python:`ndarray`
+    
+    :returns: attenuation curve
+    :rtype: :python:`ndarray`
+    '''
+    
+    return 5.472 + 0.671e3 / wavelength - 9.218e3 / wavelength**2 + 2.620e6 / wavelength**3
+
+def _uvBump(wavelength: ndarray, central: float, width: float, amplitude: float) -> ndarray:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Drude profile of the UV bump.
+    
+    :param wavelength: wavelengths in nm
+    :type wavelength: :python:`ndarray`
+    :param central: central wavelength of the bump in nm
+    :type central: :python:`float`
+    :param width: width (FWHM) of the bump in nm
+    :type width: :python:`float`
+    :param amplitude: amplitude of the bump
+    :type amplitude: :python:`float`
+    
+    :returns: the bump
+    :rtype: :python:`ndarray`
+    '''
+    
+    wg2 = (wavelength * width)**2
+    return amplitude * wg2 / ((wavelength**2 - central**2)**2 + wg2)
+
+def _ccm89(wavelength: ndarray, Rv: ndarray) -> ndarray:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Cardelli, Clayton & Mathis (1989) Milky Way extinction curve k(λ) = A(λ) / E(B-V). The infrared and far UV fits are extrapolated beyond their range of validity.
+    
+    :param wavelength: wavelengths in nm
+    :type wavelength: :python:`ndarray`
+    :param Rv: ratio of total to selective extinction as a column array
+    :type Rv: :python:`ndarray`
+    
+    :returns: extinction curve with one row per value of **Rv** and one column per wavelength
+    :rtype: :python:`ndarray`
+    '''
+    
+    x    = 1e3 / wavelength
+    a    = np.empty_like(x)
+    b    = np.empty_like(x)
+    
+    # Infrared
+    mask = x < 1.1
+    xm   = x[mask]**1.61
+    a[mask] =  0.574 * xm
+    b[mask] = -0.527 * xm
+    
+    # Optical and near infrared
+    mask = (x >= 1.1) & (x < 3.3)
+    y    = x[mask] - 1.82
+    a[mask] = np.polynomial.polynomial.polyval(y, [1, 0.17699, -0.50447, -0.02427, 0.72085, 0.01979, -0.77530, 0.32999])
+    b[mask] = np.polynomial.polynomial.polyval(y, [0, 1.41338,  2.28305,  1.07233, -5.38434, -0.62251, 5.30260, -2.09002])
+    
+    # UV
+    mask = (x >= 3.3) & (x < 8)
+    xm   = x[mask]
+    y    = np.clip(xm - 5.9, 0, None)
+    a[mask] =  1.752 - 0.316 * xm - 0.104 / ((xm - 4.67)**2 + 0.341) - 0.04473 * y**2 - 0.009779 * y**3
+    b[mask] = -3.090 + 1.825 * xm + 1.206 / ((xm - 4.62)**2 + 0.263) + 0.2130  * y**2 + 0.1207   * y**3
+    
+    # Far UV
+    mask = x >= 8
+    y    = x[mask] - 8
+    a[mask] = np.polynomial.polynomial.polyval(y, [-1.073, -0.628,  0.137, -0.070])
+    b[mask] = np.polynomial.polynomial.polyval(y, [13.670,  4.257, -0.420,  0.374])
+    
+    # k = Rv * (a + b / Rv) written without dividing every wavelength by Rv
+    return Rv * a + b
+
+def _pei92(wavelength: ndarray, Rv: ndarray, params: ndarray, RvPei: float) -> ndarray:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Pei (1992) extinction curve k(λ) = A(λ) / E(B-V). The ratio of total to selective extinction of the fit is always used.
+    
+    :param wavelength: wavelengths in nm
+    :type wavelength: :python:`ndarray`
+    :param Rv: ratio of total to selective extinction as a column array. Only its number of rows is used.
+    :type Rv: :python:`ndarray`
+    :param params: fit parameters as rows of amplitudes, central wavelengths in µm, constant terms and exponents, with one column per term
+    :type params: :python:`ndarray`
+    :param RvPei: ratio of total to selective extinction of the fit
+    :type RvPei: :python:`float`
+    
+    :returns: extinction curve with one row per value of **Rv** and one column per wavelength
+    :rtype: :python:`ndarray`
+    '''
+    
+    amp, central, const, expo = params[:, :, np.newaxis]
+    ratio = wavelength * 1e-3 / central
+    
+    # Fit of A(λ) / A(B) where A(B) = (1 + Rv) E(B-V)
+    xi    = (amp / (ratio**expo + ratio**-expo + const)).sum(axis=0)
+    
+    return np.broadcast_to((1 + RvPei) * xi, (Rv.shape[0], xi.size))
+
+#: Pei (1992) fit parameters of the LMC extinction curve
+_PEI92_LMC  = np.array([[175,   19,    0.023,  0.005,  0.006, 0.020],
+                        [0.046, 0.08,  0.22,   9.7,   18,    25    ],
+                        [90,    5.50, -1.95,  -1.95,  -1.80,  0.0  ],
+                        [2,     4.5,   2,      2,      2,     2    ]])
+
+#: Pei (1992) fit parameters of the SMC extinction curve
+_PEI92_SMC  = np.array([[185,   27,    0.005,  0.010,  0.012, 0.030],
+                        [0.042, 0.08,  0.22,   9.7,   18,    25    ],
+                        [90,    5.50, -1.95,  -1.95,  -1.80,  0.0  ],
+                        [2,     4,     2,      2,      2,     2    ]])
+
+#: Extinction curves applied to emission lines for each value of Ext_law_emission_lines
+_LINE_LAWS  = {1: _ccm89,
+               2: lambda wavelength, Rv: _pei92(wavelength, Rv, _PEI92_LMC, 3.16),
+               3: lambda wavelength, Rv: _pei92(wavelength, Rv, _PEI92_SMC, 2.93)
+              }
+
+#: Wavelength grids of the cached starburst curves, indexed by the digest of their bytes. Only the most recent grids are kept.
+_STARBURST_GRIDS: Dict[str, ndarray] = {}
+
+#: Maximum number of wavelength grids kept in _STARBURST_GRIDS
+_STARBURST_GRIDS_SIZE                = 8
+
+def _wavelengthKey(wavelength: ndarray) -> str:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Build the cache key of a wavelength grid for :py:func:`_starburstCurve` and store the grid so that the curve can be computed from the key.
+    
+    :param wavelength: wavelengths in nm
+    :type wavelength: :python:`ndarray`
+    
+    :returns: short digest of the bytes of the grid in double precision
+    :rtype: :python:`str`
+    '''
+    
+    wavelength = np.ascontiguousarray(wavelength, dtype=np.float64)
+    key        = blake2b(wavelength, digest_size=16).hexdigest()
+    
+    if key not in _STARBURST_GRIDS:
+        
+        # Dropping a grid is safe: curves cached with its key are still valid if the same grid comes back
+        if len(_STARBURST_GRIDS) >= _STARBURST_GRIDS_SIZE:
+            del _STARBURST_GRIDS[next(iter(_STARBURST_GRIDS))]
+        
+        grid = wavelength.copy()
+        grid.setflags(write=False)
+        _STARBURST_GRIDS[key] = grid
+        
+    return key
+
+@lru_cache(maxsize=256)
+def _starburstCurve(wavelength: str, central: float, width: float, amplitude: float, slope: float) -> ndarray:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Modified starburst attenuation curve k(λ) = A(λ) / E(B-V) computed as in the dustatt_modified_starburst module of Cigale. Curves are cached, so that combinations of parameters which only differ by their colour excess share the same curve.
+    
+    :param wavelength: key of the wavelength grid in nm, as returned by :py:func:`_wavelengthKey`
+    :type wavelength: :python:`str`
+    :param central: central wavelength of the UV bump in nm
+    :type central: :python:`float`
+    :param width: width (FWHM) of the UV bump in nm
+    :type width: :python:`float`
+    :param amplitude: amplitude of the UV bump
+    :type amplitude: :python:`float`
+    :param slope: slope of the power law modifying the curve
+    :type slope: :python:`float`
+    
+    :returns: read-only attenuation curve in single precision
+    :rtype: :python:`ndarray`
+    '''
+    
+    wavelength = _STARBURST_GRIDS[wavelength]
+    curve      = np.where(wavelength < 150, _kLeitherer(wavelength), _kCalzetti(wavelength))
+    curve     += _uvBump(wavelength, central, width, amplitude)
+    curve     *= (wavelength / 550)**slope
+    
+    # The power law changes E(B-V), so the curve is rescaled to keep the E(B-V) of the starburst curve with the same bump
+    wlBV       = np.array([440.0, 550.0])
+    ebvStar    = _kCalzetti(wlBV) + _uvBump(wlBV, central, width, amplitude)
+    ebvMod     = ebvStar * (wlBV / 550)**slope
+    curve     *= (ebvStar[0] - ebvStar[1]) / (ebvMod[0] - ebvMod[1])
+    
+    # Single precision is enough to attenuate spectra and halves the memory used by the cache
+    curve      = curve.astype(np.float32)
+    curve.setflags(write=False)
+    return curve
+
+@lru_cache(maxsize=None)
+def _splitFilters(filters: str) -> Tuple[str, ...]:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Split a string of filter names separated by a &. Results are cached and names are interned, so that all the attenuation modules using the same filters share the same tuple and name objects.
+    
+    :param filters: filter names separated by a &
+    :type filters: :python:`str`
+    
+    :returns: the filter names, without surrounding spaces
+    :rtype: :python:`tuple` [:python:`str`]
+    '''
+    
+    return tuple(intern(name.strip()) for name in filters.split('&') if name.strip())
+
+class ATTENUATIONmodule(CigaleModule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -898,32 +1436,36 @@ class ATTENUATIONmodule(ABC):
     :param str filters: (**Optional**) filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).
     '''
     
+    __slots__ = ('name', 'filters', '_filterList')
+    
     def __init__(self, name: Any, filters: str = 'V_B90 & FUV') -> None:
         r'''Init method.'''
         
-        self.name    = name
-        self.filters = StrProperty(filters)
-        
-    @abstractmethod
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
+        self.name        = name
+        self.filters     = StrProperty(filters)
+        self._filterList = ('', ())
         
-        return
-    
     @property
-    @abstractmethod
-    def spec(self, *args, **kwargs) -> str:
+    def filterList(self) -> Tuple[str, ...]:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation for the .spec file of Cigale parameters.
+        Names of the filters for which the attenuation is computed. The filters string is only split again if it changed since the last call, and modules with the same filters share the same tuple.
+        
+        :returns: the filter names, without surrounding spaces
+        :rtype: :python:`tuple` [:python:`str`]
         '''
         
-        return
+        filters, names = self._filterList
+        if filters is not self.filters.value:
+            
+            filters = self.filters.value
+            names   = _splitFilters(filters)
+            
+            # Bypass __setattr__ so that the cached text is kept
+            object.__setattr__(self, '_filterList', (filters, names))
+            
+        return names
     
 class DUSTATT_POWERLAWmodule(ATTENUATIONmodule):
     r'''
@@ -940,56 +1482,40 @@ class DUSTATT_POWERLAWmodule(ATTENUATIONmodule):
     :param list powerlaw_slope: (**Optional**) slope delta of the power law modifying the attenuation curve
     '''
     
+    __slots__ = ('Av_young', 'Av_old_factor', 'uv_bump_wavelength', 'uv_bump_width', 'uv_bump_amplitude', 'powerlaw_slope')
+    
+    _SECTION = 'dustatt_powerlaw'
+    _FIELDS  = (('Av_young',           'V-band attenuation of the young population.'),
+                ('Av_old_factor',      'Reduction factor for the V-band attenuation of the old population compared to the young one (<1).'),
+                ('uv_bump_wavelength', 'Central wavelength of the UV bump in nm.'),
+                ('uv_bump_width',      'Width (FWHM) of the UV bump in nm.'),
+                ('uv_bump_amplitude',  'Amplitude of the UV bump. For the Milky Way: 0.75'),
+                ('powerlaw_slope',     'Slope delta of the power law continuum.'),
+                ('filters',            "Filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).")
+               )
+    
+    _PROPERTIES = {'Av_young'           : (ListFloatProperty, dict(minBound=0.0)),
+                   'Av_old_factor'      : (ListFloatProperty, dict(minBound=0.0, maxBound=1.0)),
+                   'uv_bump_wavelength' : (ListFloatProperty, dict(minBound=0.0)),
+                   'uv_bump_width'      : (ListFloatProperty, dict(minBound=0.0)),
+                   'uv_bump_amplitude'  : (ListFloatProperty, dict(minBound=0.0)),
+                   'powerlaw_slope'     : (ListFloatProperty, dict())
+                  }
+    
     def __init__(self, filters: str              = 'V_B90 & FUV',
-                 Av_young: List[float]           = [1.0],
-                 Av_old_factor: List[float]      = [0.44],
-                 uv_bump_wavelength: List[float] = [217.5],
-                 uv_bump_width: List[float]      = [35.0],
-                 uv_bump_amplitude: List[float]  = [0.0],
-                 powerlaw_slope: List[float]     = [-0.7]) -> None:
+                 Av_young: list[float]           = [1.0],
+                 Av_old_factor: list[float]      = [0.44],
+                 uv_bump_wavelength: list[float] = [217.5],
+                 uv_bump_width: list[float]      = [35.0],
+                 uv_bump_amplitude: list[float]  = [0.0],
+                 powerlaw_slope: list[float]     = [-0.7]) -> None:
         
         r'''Init method.'''
         
         super().__init__('dustatt_powerlaw', filters=filters)
         
-        self.filters            = StrProperty(filters)
-        self.Av_young           = ListFloatProperty(Av_young,           minBound=0.0)
-        self.Av_old_factor      = ListFloatProperty(Av_old_factor,      minBound=0.0, maxBound=1.0)
-        self.uv_bump_wavelength = ListFloatProperty(uv_bump_wavelength, minBound=0.0)
-        self.uv_bump_width      = ListFloatProperty(uv_bump_width,      minBound=0.0)
-        self.uv_bump_amplitude  = ListFloatProperty(uv_bump_amplitude,  minBound=0.0)
-        self.powerlaw_slope     = ListFloatProperty(powerlaw_slope)
+        self._setProperties(locals())
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[dustatt_powerlaw]]
-          # V-band attenuation of the young population.
-          Av_young = {self.Av_young}
-          # Reduction factor for the V-band attenuation of the old population
-          # compared to the young one (<1).
-          Av_old_factor = {self.Av_old_factor}
-          # Central wavelength of the UV bump in nm.
-          uv_bump_wavelength = {self.uv_bump_wavelength}
-          # Width (FWHM) of the UV bump in nm.
-          uv_bump_width = {self.uv_bump_width}
-          # Amplitude of the UV bump. For the Milky Way: 0.75
-          uv_bump_amplitude = {self.uv_bump_amplitude}
-          # Slope delta of the power law continuum.
-          powerlaw_slope = {self.powerlaw_slope}
-          # Filters for which the attenuation will be computed and added to the
-          # SED information dictionary. You can give several filter names
-          # separated by a & (don't use commas).
-          filters = {self.filters}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1024,47 +1550,34 @@ class DUSTATT_2POWERLAWSmodule(ATTENUATIONmodule):
     :param list slope_ISM: (**optional**) power law slope of the attenuation in the ISM
     '''
     
+    __slots__ = ('Av_BC', 'slope_BC', 'BC_to_ISM_factor', 'slope_ISM')
+    
+    _SECTION = 'dustatt_2powerlaws'
+    _FIELDS  = (('Av_BC',            'V-band attenuation in the birth clouds.'),
+                ('slope_BC',         'Power law slope of the attenuation in the birth clouds.'),
+                ('BC_to_ISM_factor', 'Av ISM / Av BC (<1).'),
+                ('slope_ISM',        'Power law slope of the attenuation in the ISM.'),
+                ('filters',          "Filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).")
+               )
+    
+    _PROPERTIES = {'Av_BC'            : (ListFloatProperty, dict(minBound=0.0)),
+                   'slope_BC'         : (ListFloatProperty, dict()),
+                   'BC_to_ISM_factor' : (ListFloatProperty, dict(minBound=0.0, maxBound=1.0)),
+                   'slope_ISM'        : (ListFloatProperty, dict())
+                  }
+    
     def __init__(self, filters: str            = 'V_B90 & FUV',
-                 Av_BC: List[float]            = [1.0],
-                 slope_BC: List[float]         = [-1.3],
-                 BC_to_ISM_factor: List[float] = [0.44],
-                 slope_ISM: List[float]        = [-0.7]) -> None:
+                 Av_BC: list[float]            = [1.0],
+                 slope_BC: list[float]         = [-1.3],
+                 BC_to_ISM_factor: list[float] = [0.44],
+                 slope_ISM: list[float]        = [-0.7]) -> None:
         
         r'''Init method.'''
         
         super().__init__('dustatt_2powerlaws', filters=filters)
         
-        self.filters          = StrProperty(filters)
-        self.Av_BC            = ListFloatProperty(Av_BC,            minBound=0.0)
-        self.slope_BC         = ListFloatProperty(slope_BC)
-        self.BC_to_ISM_factor = ListFloatProperty(BC_to_ISM_factor, minBound=0.0, maxBound=1.0)
-        self.slope_ISM        = ListFloatProperty(slope_ISM)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        self._setProperties(locals())
         
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[dustatt_2powerlaws]]
-          # V-band attenuation in the birth clouds.
-          Av_BC = {self.av_BC}
-          # Power law slope of the attenuation in the birth clouds.
-          slope_BC = {self.slope_BC}
-          # Av ISM / Av BC (<1).
-          BC_to_ISM_factor = {self.BC_to_ISM_factor}
-          # Power law slope of the attenuation in the ISM.
-          slope_ISM = {self.slope_ISM}
-          # Filters for which the attenuation will be computed and added to the
-          # SED information dictionary. You can give several filter names
-          # separated by a & (don't use commas).
-          filters = {self.filters}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1099,57 +1612,40 @@ class DUSTATT_CALZLEITmodule(ATTENUATIONmodule):
     :param list powerlaw_slope: (**Optional**) slope delta of the power law modifying the attenuation curve
     '''
     
+    __slots__ = ('E_BVs_young', 'E_BVs_old_factor', 'uv_bump_wavelength', 'uv_bump_width', 'uv_bump_amplitude', 'powerlaw_slope')
+    
+    _SECTION = 'dustatt_calzleit'
+    _FIELDS  = (('E_BVs_young',        'E(B-V)*, the colour excess of the stellar continuum light for the young population.'),
+                ('E_BVs_old_factor',   'Reduction factor for the E(B-V)* of the old population compared to the young one (<1).'),
+                ('uv_bump_wavelength', 'Central wavelength of the UV bump in nm.'),
+                ('uv_bump_width',      'Width (FWHM) of the UV bump in nm.'),
+                ('uv_bump_amplitude',  'Amplitude of the UV bump. For the Milky Way: 3.'),
+                ('powerlaw_slope',     'Slope delta of the power law modifying the attenuation curve.'),
+                ('filters',            "Filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).")
+               )
+    
+    _PROPERTIES = {'E_BVs_young'        : (ListFloatProperty, dict(minBound=0.0)),
+                   'E_BVs_old_factor'   : (ListFloatProperty, dict(minBound=0.0, maxBound=1.0)),
+                   'uv_bump_wavelength' : (ListFloatProperty, dict(minBound=0.0)),
+                   'uv_bump_width'      : (ListFloatProperty, dict(minBound=0.0)),
+                   'uv_bump_amplitude'  : (ListFloatProperty, dict(minBound=0.0)),
+                   'powerlaw_slope'     : (ListFloatProperty, dict())
+                  }
+    
     def __init__(self, filters: str              = 'B_B90 & V_B90 & FUV',
-                 E_BVs_young: List[float]        = [0.3],
-                 E_BVs_old_factor: List[float]   = [1.0],
-                 uv_bump_wavelength: List[float] = [217.5],
-                 uv_bump_width: List[float]      = [35.0],
-                 uv_bump_amplitude: List[float]  = [0.0],
-                 powerlaw_slope: List[float]     = [0.0]) -> None:
+                 E_BVs_young: list[float]        = [0.3],
+                 E_BVs_old_factor: list[float]   = [1.0],
+                 uv_bump_wavelength: list[float] = [217.5],
+                 uv_bump_width: list[float]      = [35.0],
+                 uv_bump_amplitude: list[float]  = [0.0],
+                 powerlaw_slope: list[float]     = [0.0]) -> None:
         
         r'''Init method.'''
         
         super().__init__('dustatt_calzleit', filters=filters)
         
-        self.filters            = StrProperty(filters)
-        self.E_BVs_young        = ListFloatProperty(E_BVs_young,        minBound=0.0)
-        self.E_BVs_old_factor   = ListFloatProperty(E_BVs_old_factor,   minBound=0.0, maxBound=0.0)
-        self.uv_bump_wavelength = ListFloatProperty(uv_bump_wavelength, minBound=0.0)
-        self.uv_bump_width      = ListFloatProperty(uv_bump_width,      minBound=0.0)
-        self.uv_bump_amplitude  = ListFloatProperty(uv_bump_amplitude,  minBound=0.0)
-        self.powerlaw_slope     = ListFloatProperty(powerlaw_slope)
+        self._setProperties(locals())
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[dustatt_calzleit]]
-          # E(B-V)*, the colour excess of the stellar continuum light for the
-          # young population.
-          E_BVs_young = {self.E_BVs_young}
-          # Reduction factor for the E(B-V)* of the old population compared to the
-          # young one (<1).
-          E_BVs_old_factor = {self.E_BVs_old_factor}
-          # Central wavelength of the UV bump in nm.
-          uv_bump_wavelength = {self.uv_bump_wavelength}
-          # Width (FWHM) of the UV bump in nm.
-          uv_bump_width = {self.uv_bump_width}
-          # Amplitude of the UV bump. For the Milky Way: 3.
-          uv_bump_amplitude = {self.uv_bump_amplitude}
-          # Slope delta of the power law modifying the attenuation curve.
-          powerlaw_slope = {self.powerlaw_slope}
-          # Filters for which the attenuation will be computed and added to the
-          # SED information dictionary. You can give several filter names
-          # separated by a & (don't use commas).
-          filters = {self.filters}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1184,149 +1680,252 @@ class DUSTATT_MODIFIED_CF00module(ATTENUATIONmodule):
     :param list slope_BC: (**Optional**) power law slope of the attenuation in the birth clouds
     '''
     
+    __slots__ = ('Av_ISM', 'mu', 'slope_ISM', 'slope_BC')
+    
+    _SECTION = 'dustatt_modified_CF00'
+    _FIELDS  = (('Av_ISM',    'V-band attenuation in the interstellar medium.'),
+                ('mu',        'Av_ISM / (Av_BC+Av_ISM)'),
+                ('slope_ISM', 'Power law slope of the attenuation in the ISM.'),
+                ('slope_BC',  'Power law slope of the attenuation in the birth clouds.'),
+                ('filters',   "Filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).")
+               )
+    
+    _PROPERTIES = {'Av_ISM'    : (ListFloatProperty, dict(minBound=0.0)),
+                   'mu'        : (ListFloatProperty, dict(minBound=0.0001, maxBound=1.0)),
+                   'slope_ISM' : (ListFloatProperty, dict()),
+                   'slope_BC'  : (ListFloatProperty, dict())
+                  }
+    
     def __init__(self, filters: str     = 'V_B90 & FUV',
-                 Av_ISM: List[float]    = [1.0],
-                 mu: List[float]        = [0.44],
-                 slope_ISM: List[float] = [-0.7],
-                 slope_BC: List[float]  = [-1.3]) -> None:
+                 Av_ISM: list[float]    = [1.0],
+                 mu: list[float]        = [0.44],
+                 slope_ISM: list[float] = [-0.7],
+                 slope_BC: list[float]  = [-1.3]) -> None:
         
         r'''Init method.'''
         
         super().__init__('dustatt_modified_cf00', filters=filters)
         
-        self.filters   = StrProperty(filters)
-        self.Av_ISM    = ListFloatProperty(Av_ISM, minBound=0.0)
-        self.mu        = ListFloatProperty(mu,     minBound=0.0001, maxBound=1.0)
-        self.slope_ISM = ListFloatProperty(slope_ISM)
-        self.slope_ISM = ListFloatProperty(slope_BC)
+        self._setProperties(locals())
+        
+    @property
+    def spec(self, *args, **kwargs) -> str:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Implement a string representation for the .spec file of Cigale parameters.
+        '''
+        
+        text = '''\
+        [[dustatt_modified_CF00]]
+          Av_ISM = cigale_list(minvalue=0)
+          mu = cigale_list(minvalue=.0001, maxvalue=1.)
+          slope_ISM = cigale_list()
+          slope_BC = cigale_list()
+          filters = string()\
+        '''
+        
+        return text
+    
+class DUSTATT_MODIFIED_STARBUSTmodule(ATTENUATIONmodule):
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Class implementing a modified Calzetti 2000 attenuation law module.
+    
+    :param str filters: (**Optional**) filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).
+    :param list E_BV_lines: (**Optional**) E(B-V)l, the colour excess of the nebular lines light for both the young and old population
+    :param list E_BV_factor: (**Optional**) reduction factor to apply on E_BV_lines to compute E(B-V)s the stellar continuum attenuation. Both young and old population are attenuated with E(B-V)s.
+    :param list uv_bump_wavelength: (**Optional**) central wavelength of the UV bump in nm
+    :param list uv_bump_width: (**Optional**) width (FWHM) of the UV bump in nm
+    :param list uv_bump_amplitude: (**Optional**) amplitude of the UV bump. For the Milky Way: 3.
+    :param list powerlaw_slope: (**Optional**) slope delta of the power law modifying the attenuation curve
+    :param list Ext_law_emission_lines: (**Optional**) extinction law to use for attenuating the emission lines flux. Possible values are: 1, 2, 3. 1: MW, 2: LMC, 3: SMC. MW is modelled using CCM89, SMC and LMC using Pei92.
+    :param list Rv: (**Optional**) ratio of total to selective extinction, A_V / E(B-V), for the extinction curve applied to emission lines. Standard value is 3.1 for MW using CCM89, but can be changed.F or SMC and LMC using Pei92 the value is automatically set to 2.93 and 3.16 respectively, no matter the value you write.
+    '''
+    
+    __slots__ = ('E_BV_lines', 'E_BV_factor', 'uv_bump_wavelength', 'uv_bump_width', 'uv_bump_amplitude', 'powerlaw_slope', 'Ext_law_emission_lines', 'Rv')
+    
+    _SECTION = 'dustatt_modified_starburst'
+    _FIELDS  = (('E_BV_lines',             'E(B-V)l, the colour excess of the nebular lines light for both the young and old population.'),
+                ('E_BV_factor',            'Reduction factor to apply on E_BV_lines to compute E(B-V)s the stellar continuum attenuation. Both young and old population are attenuated with E(B-V)s.'),
+                ('uv_bump_wavelength',     'Central wavelength of the UV bump in nm.'),
+                ('uv_bump_width',          'Width (FWHM) of the UV bump in nm.'),
+                ('uv_bump_amplitude',      'Amplitude of the UV bump. For the Milky Way: 3.'),
+                ('powerlaw_slope',         'Slope delta of the power law modifying the attenuation curve.'),
+                ('Ext_law_emission_lines', 'Extinction law to use for attenuating the emissio  n lines flux. Possible values are: 1, 2, 3. 1: MW, 2: LMC, 3: SMC. MW is modelled using CCM89, SMC and LMC using Pei92.'),
+                ('Rv',                     'Ratio of total to selective extinction, A_V / E(B-V), for the extinction curve applied to emission lines.Standard value is 3.1 for MW using CCM89, but can be changed.For SMC and LMC using Pei92 the value is automatically set to 2.93 and 3.16 respectively, no matter the value you write.'),
+                ('filters',                "Filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).")
+               )
+    
+    _PROPERTIES = {'E_BV_lines'             : (ListFloatProperty, dict(minBound=0.0)),
+                   'E_BV_factor'            : (ListFloatProperty, dict(minBound=0.0, maxBound=1.0)),
+                   'uv_bump_wavelength'     : (ListFloatProperty, dict(minBound=0.0)),
+                   'uv_bump_width'          : (ListFloatProperty, dict(minBound=0.0)),
+                   'uv_bump_amplitude'      : (ListFloatProperty, dict(minBound=0.0)),
+                   'powerlaw_slope'         : (ListFloatProperty, dict()),
+                   'Ext_law_emission_lines' : (ListIntProperty,   dict(minBound=1, maxBound=3)),
+                   'Rv'                     : (ListFloatProperty, dict())
+                  }
+    
+    def __init__(self, filters: str                = 'B_B90 & V_B90 & FUV',
+                 E_BV_lines: list[float]           = [0.3],
+                 E_BV_factor: list[float]          = [0.44],
+                 uv_bump_wavelength: list[float]   = [217.5],
+                 uv_bump_width: list[float]        = [35.0],
+                 uv_bump_amplitude: list[float]    = [0.0],
+                 powerlaw_slope: list[float]       = [0.0],
+                 Ext_law_emission_lines: list[int] = [1],
+                 Rv: list[float]                   = [3.1]) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('dustatt_modified_starbust', filters=filters)
+        
+        self._setProperties(locals())
+        
+    @property
+    def isIdentity(self) -> bool:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Whether the stellar continuum is left unchanged for all the combinations of parameters, that is whether the colour excess E(B-V)s = **E_BV_lines** * **E_BV_factor** is always null.
+        
+        :returns: :python:`True` if no combination attenuates the continuum, :python:`False` otherwise
+        :rtype: :python:`bool`
+        '''
+        
+        return not (np.any(self.E_BV_lines.value) and np.any(self.E_BV_factor.value))
+    
+    def attenuation(self, wavelength: ndarray) -> ndarray:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Compute the attenuation of the stellar continuum at once for all the combinations of parameters.
+        
+        :param wavelength: wavelengths in nm
+        :type wavelength: :python:`ndarray`
+        
+        :returns: attenuation in mag in single precision with one row per combination of the continuum parameters (ordered as in :python:`itertools.product` over **E_BV_lines**, **E_BV_factor**, **uv_bump_wavelength**, **uv_bump_width**, **uv_bump_amplitude** and **powerlaw_slope**) and one column per wavelength
+        :rtype: :python:`ndarray`
+        '''
+        
+        E_BV_lines, E_BV_factor, central, width, amplitude, slope = self._grid(self.E_BV_lines, self.E_BV_factor, self.uv_bump_wavelength, self.uv_bump_width, self.uv_bump_amplitude, self.powerlaw_slope)
+        
+        key    = _wavelengthKey(wavelength)
+        curves = np.stack([_starburstCurve(key, *params) for params in zip(central[:, 0].tolist(), width[:, 0].tolist(), amplitude[:, 0].tolist(), slope[:, 0].tolist())])
+        
+        return (E_BV_lines * E_BV_factor).astype(np.float32) * curves
+        
+    def apply(self, wavelength: ndarray, flux: ndarray) -> ndarray:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Attenuate the stellar continuum of a spectrum at once for all the combinations of parameters.
+        
+        :param wavelength: wavelengths in nm
+        :type wavelength: :python:`ndarray`
+        :param flux: flux density at each wavelength
+        :type flux: :python:`ndarray`
+        
+        :returns: attenuated flux density in single precision with one row per combination of parameters (ordered as in :py:meth:`attenuation`) and one column per wavelength. If :py:attr:`isIdentity` is :python:`True`, this is a read-only view of the flux repeated for each combination.
+        :rtype: :python:`ndarray`
+        '''
+        
+        if self.isIdentity:
+            return self._unattenuated(flux)
+        
+        transmission = self._transmission(wavelength)
+        return np.multiply(transmission, flux, out=transmission, casting='same_kind')
+    
+    def applyToMany(self, wavelength: ndarray, fluxes: ndarray) -> ndarray:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Attenuate the stellar continuum of several spectra sharing the same wavelengths at once for all the combinations of parameters. The transmission is only computed once for all the spectra.
+        
+        :param wavelength: wavelengths in nm
+        :type wavelength: :python:`ndarray`
+        :param fluxes: flux densities with one row per spectrum and one column per wavelength
+        :type fluxes: :python:`ndarray`
+        
+        :returns: attenuated flux densities in single precision with shape (combination of parameters, spectrum, wavelength), combinations being ordered as in :py:meth:`attenuation`. If :py:attr:`isIdentity` is :python:`True`, this is a read-only view of the flux densities repeated for each combination.
+        :rtype: :python:`ndarray`
+        '''
+        
+        if self.isIdentity:
+            return self._unattenuated(fluxes)
+        
+        fluxes       = np.asarray(fluxes)
+        transmission = self._transmission(wavelength)
+        out          = np.empty((transmission.shape[0],) + fluxes.shape, dtype=np.float32)
         
-    def __str__(self, *args, **kwargs) -> str:
+        return np.multiply(transmission[:, np.newaxis, :], fluxes, out=out, casting='same_kind')
+    
+    def _transmission(self, wavelength: ndarray) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
+        Compute the transmission of the stellar continuum 10**(-0.4 A) for all the combinations of parameters.
         
-        text = f'''\
-        [[dustatt_modified_CF00]]
-          # V-band attenuation in the interstellar medium.
-          Av_ISM = {self.Av_ISM}
-          # Av_ISM / (Av_BC+Av_ISM)
-          mu = {self.mu}
-          # Power law slope of the attenuation in the ISM.
-          slope_ISM = {self.slope_ISM}
-          # Power law slope of the attenuation in the birth clouds.
-          slope_BC = {self.slope_BC}
-          # Filters for which the attenuation will be computed and added to the
-          # SED information dictionary. You can give several filter names
-          # separated by a & (don't use commas).
-          filters = {self.filters}
+        :param wavelength: wavelengths in nm
+        :type wavelength: :python:`ndarray`
+        
+        :returns: transmission in single precision with one row per combination of parameters and one column per wavelength
+        :rtype: :python:`ndarray`
         '''
         
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
+        # Computed in place as exp(-0.4 ln(10) A) which avoids the generic power function
+        transmission  = self.attenuation(wavelength)
+        transmission *= _MAG_TO_LN
+        np.exp(transmission, out=transmission)
+        
+        return transmission
+        
+    def _unattenuated(self, flux: ndarray) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[dustatt_modified_CF00]]
-          Av_ISM = cigale_list(minvalue=0)
-          mu = cigale_list(minvalue=.0001, maxvalue=1.)
-          slope_ISM = cigale_list()
-          slope_BC = cigale_list()
-          filters = string()\
-        '''
+        Return the flux unchanged for all the combinations of parameters, without computing the curves nor multiplying by a transmission of one.
         
-        return text
-    
-class DUSTATT_MODIFIED_STARBUSTmodule(ATTENUATIONmodule):
-    r'''
-    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-    
-    Class implementing a modified Calzetti 2000 attenuation law module.
-    
-    :param str filters: (**Optional**) filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).
-    :param list E_BV_lines: (**Optional**) E(B-V)l, the colour excess of the nebular lines light for both the young and old population
-    :param list E_BV_factor: (**Optional**) reduction factor to apply on E_BV_lines to compute E(B-V)s the stellar continuum attenuation. Both young and old population are attenuated with E(B-V)s.
-    :param list uv_bump_wavelength: (**Optional**) central wavelength of the UV bump in nm
-    :param list uv_bump_width: (**Optional**) width (FWHM) of the UV bump in nm
-    :param list uv_bump_amplitude: (**Optional**) amplitude of the UV bump. For the Milky Way: 3.
-    :param list powerlaw_slope: (**Optional**) slope delta of the power law modifying the attenuation curve
-    :param list Ext_law_emission_lines: (**Optional**) extinction law to use for attenuating the emission lines flux. Possible values are: 1, 2, 3. 1: MW, 2: LMC, 3: SMC. MW is modelled using CCM89, SMC and LMC using Pei92.
-    :param list Rv: (**Optional**) ratio of total to selective extinction, A_V / E(B-V), for the extinction curve applied to emission lines. Standard value is 3.1 for MW using CCM89, but can be changed.F or SMC and LMC using Pei92 the value is automatically set to 2.93 and 3.16 respectively, no matter the value you write.
-    '''
-    
-    def __init__(self, filters: str                = 'B_B90 & V_B90 & FUV',
-                 E_BV_lines: List[float]           = [0.3],
-                 E_BV_factor: List[float]          = [0.44],
-                 uv_bump_wavelength: List[float]   = [217.5],
-                 uv_bump_width: List[float]        = [35.0],
-                 uv_bump_amplitude: List[float]    = [0.0],
-                 powerlaw_slope: List[float]       = [0.0],
-                 Ext_law_emission_lines: List[int] = 1,
-                 Rv: List[float]                   = 3.1) -> None:
+        :param flux: flux density or flux densities with one column per wavelength
+        :type flux: :python:`ndarray`
         
-        r'''Init method.'''
+        :returns: read-only view of the flux in single precision with one more leading axis of one entry per combination of parameters (the flux is only copied if it is not already in single precision)
+        :rtype: :python:`ndarray`
+        '''
         
-        super().__init__('dustatt_modified_starbust', filters=filters)
+        flux = np.asarray(flux, dtype=np.float32)
+        size = np.prod([np.size(prop.value) for prop in (self.E_BV_lines, self.E_BV_factor, self.uv_bump_wavelength, self.uv_bump_width, self.uv_bump_amplitude, self.powerlaw_slope)])
         
-        self.filters                = StrProperty(filters)
-        self.E_BV_lines             = ListFloatProperty(E_BV_lines,           minBound=0.0)
-        self.E_BV_factor            = ListFloatProperty(E_BV_factor,          minBound=0.0, maxBound=0.0)
-        self.uv_bump_wavelength     = ListFloatProperty(uv_bump_wavelength,   minBound=0.0)
-        self.uv_bump_width          = ListFloatProperty(uv_bump_width,        minBound=0.0)
-        self.uv_bump_amplitude      = ListFloatProperty(uv_bump_amplitude,    minBound=0.0)
-        self.powerlaw_slope         = ListFloatProperty(powerlaw_slope)
-        self.Ext_law_emission_lines = ListIntProperty(Ext_law_emission_lines, minBound=1, maxBound=3)
-        self.Rv                     = ListFloatProperty(Rv)
+        return np.broadcast_to(flux, (int(size),) + flux.shape)
         
-    def __str__(self, *args, **kwargs) -> str:
+    def lineAttenuation(self, wavelength: ndarray) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
+        Compute the attenuation of the emission lines at once for all the combinations of parameters. The extinction curve is computed once for all the combinations sharing the same law.
         
-        text = f'''\
-        [[dustatt_modified_starburst]]
-          # E(B-V)l, the colour excess of the nebular lines light for both the
-          # young and old population.
-          E_BV_lines = {self.E_BV_lines}
-          # Reduction factor to apply on E_BV_lines to compute E(B-V)s the stellar
-          # continuum attenuation. Both young and old population are attenuated
-          # with E(B-V)s.
-          E_BV_factor = {self.E_BV_factor}
-          # Central wavelength of the UV bump in nm.
-          uv_bump_wavelength = {self.uv_bump_wavelength}
-          # Width (FWHM) of the UV bump in nm.
-          uv_bump_width = {self.uv_bump_width}
-          # Amplitude of the UV bump. For the Milky Way: 3.
-          uv_bump_amplitude = {self.uv_bump_amplitude}
-          # Slope delta of the power law modifying the attenuation curve.
-          powerlaw_slope = {self.powerlaw_slope}
-          # Extinction law to use for attenuating the emissio  n lines flux.
-          # Possible values are: 1, 2, 3. 1: MW, 2: LMC, 3: SMC. MW is modelled
-          # using CCM89, SMC and LMC using Pei92.
-          Ext_law_emission_lines = {self.Ext_law_emission_lines}
-          # Ratio of total to selective extinction, A_V / E(B-V), for the
-          # extinction curve applied to emission lines.Standard value is 3.1 for
-          # MW using CCM89, but can be changed.For SMC and LMC using Pei92 the
-          # value is automatically set to 2.93 and 3.16 respectively, no matter
-          # the value you write.
-          Rv = {self.Rv}
-          # Filters for which the attenuation will be computed and added to the
-          # SED information dictionary. You can give several filter names
-          # separated by a & (don't use commas).
-          filters = {self.filters}
+        :param wavelength: wavelengths of the lines in nm
+        :type wavelength: :python:`ndarray`
+        
+        :returns: attenuation in mag in single precision with one row per combination of the line parameters (ordered as in :python:`itertools.product` over **E_BV_lines**, **Ext_law_emission_lines** and **Rv**) and one column per wavelength
+        :rtype: :python:`ndarray`
         '''
         
-        return text
-    
+        E_BV_lines, law, Rv = self._grid(self.E_BV_lines, self.Ext_law_emission_lines, self.Rv)
+        
+        wavelength = np.asarray(wavelength, dtype=float)
+        curves     = np.empty((law.shape[0], wavelength.size), dtype=np.float32)
+        
+        for code, kernel in _LINE_LAWS.items():
+            rows = law[:, 0] == code
+            
+            if rows.any():
+                curves[rows] = kernel(wavelength, Rv[rows])
+                
+        return E_BV_lines.astype(np.float32) * curves
+        
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1354,7 +1953,7 @@ class DUSTATT_MODIFIED_STARBUSTmodule(ATTENUATIONmodule):
 #        Dust emission        #
 ###############################
 
-class DUSTmodule(ABC):
+class DUSTmodule(CigaleModule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -1363,6 +1962,8 @@ class DUSTmodule(ABC):
     :param name: identifier for the class
     '''
     
+    __slots__ = ('name',)
+    
     def __init__(self, name, *args, **kwargs):
         r'''Init method.'''
         
@@ -1370,27 +1971,6 @@ class DUSTmodule(ABC):
         
         return
         
-    @abstractmethod
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        return
-    
-    @property
-    @abstractmethod
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        return
-    
 class MBBmodule(DUSTmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
@@ -1403,42 +1983,32 @@ class MBBmodule(DUSTmodule):
     :param bool energy_balance: Energy balance checked ? If False, Lum[MBB] not taken into account in energy balance.
     '''
     
-    def __init__(self, epsilon_mbb: List[float] = [0.5],
-                 t_mbb: List[float]             = [50.0],
-                 beta_mbb: List[float]          = [1.5],
+    __slots__ = ('epsilon_mbb', 't_mbb', 'beta_mbb', 'energy_balance')
+    
+    _SECTION = 'mbb'
+    _FIELDS  = (('epsilon_mbb',    'Fraction [>= 0] of L_dust(energy balance) in the MBB'),
+                ('t_mbb',          'Temperature of black body in K.'),
+                ('beta_mbb',       'Emissivity index of modified black body.'),
+                ('energy_balance', 'Energy balance checked?If False, Lum[MBB] not taken into account in energy balance')
+               )
+    
+    _PROPERTIES = {'epsilon_mbb'    : (ListFloatProperty, dict(minBound=0.0, maxBound=1.0)),
+                   't_mbb'          : (ListFloatProperty, dict(minBound=0.0)),
+                   'beta_mbb'       : (ListFloatProperty, dict()),
+                   'energy_balance' : (BoolProperty,      dict())
+                  }
+    
+    def __init__(self, epsilon_mbb: list[float] = [0.5],
+                 t_mbb: list[float]             = [50.0],
+                 beta_mbb: list[float]          = [1.5],
                  energy_balance: bool           = False) -> None:
         
         r'''Init method.'''
             
         super().__init__('mbb')
         
-        self.epsilon_mbb    = ListFloatProperty(epsilon_mbb, minBound=0.0, maxBound=1.0)
-        self.t_mbb          = ListFloatProperty(t_mbb,       minBound=0.0)
-        self.beta_mbb       = ListFloatProperty(beta_mbb)
-        self.energy_balance = BoolProperty(energy_balance)
+        self._setProperties(locals())
             
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[mbb]]
-          # Fraction [>= 0] of L_dust(energy balance) in the MBB
-          epsilon_mbb = {self.epsilon_mbb}
-          # Temperature of black body in K.
-          t_mbb = {self.t_mbb}
-          # Emissivity index of modified black body.
-          beta_mbb = {self.beta_mbb}
-          # Energy balance checked?If False, Lum[MBB] not taken into account in
-          # energy balance
-          energy_balance = {self.energy_balance}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1467,8 +2037,15 @@ class SCHREIBERmodule(DUSTmodule):
     :param list fpah: emissivity index of the dust
     '''
     
-    def __init__(self, tdust: List[int] = [20],
-                 fpah: List[float]      = [0.05]) -> None:
+    __slots__ = ('tdust', 'fpah')
+    
+    _SECTION = 'schreiber2016'
+    _FIELDS  = (('tdust', 'Dust temperature. Between 15 and 60K, with 1K step.'),
+                ('fpah',  'Mass fraction of PAH. Between 0 and 1.')
+               )
+    
+    def __init__(self, tdust: list[int] = [20],
+                 fpah: list[float]      = [0.05]) -> None:
         
         r'''Init method.'''
             
@@ -1477,28 +2054,11 @@ class SCHREIBERmodule(DUSTmodule):
         tdustRange = [15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60]
             
         self.tdust = ListFloatProperty(tdust, minBound=15, maxBound=60,
-                                       testFunc=lambda value: any((i not in tdustRange for i in value)),
+                                       testFunc=_optionTest(tdustRange),
                                        testMsg=f'one of tdust values is not in the list {tdustRange}')
         
         self.fpah  = ListFloatProperty(fpah, minBound=0.0, maxBound=1.0)
             
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[schreiber2016]]
-          # Dust temperature. Between 15 and 60K, with 1K step.
-          tdust = {self.tdust}
-          # Mass fraction of PAH. Between 0 and 1.
-          fpah = {self.fpah}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1526,37 +2086,29 @@ class CASEYmodule(DUSTmodule):
     :param list alpha: mid-infrared powerlaw slope
     '''
     
-    def __init__(self, temperature: List[float] = [35.0],
-                 beta: List[float]              = [1.6],
-                 alpha: List[float]             = [2.0]) -> None:
+    __slots__ = ('temperature', 'beta', 'alpha')
+    
+    _SECTION = 'casey2012'
+    _FIELDS  = (('temperature', 'Temperature of the dust in K.'),
+                ('beta',        'Emissivity index of the dust.'),
+                ('alpha',       'Mid-infrared powerlaw slope.')
+               )
+    
+    _PROPERTIES = {'temperature' : (ListFloatProperty, dict(minBound=0.0)),
+                   'beta'        : (ListFloatProperty, dict(minBound=0.0)),
+                   'alpha'       : (ListFloatProperty, dict(minBound=0.0))
+                  }
+    
+    def __init__(self, temperature: list[float] = [35.0],
+                 beta: list[float]              = [1.6],
+                 alpha: list[float]             = [2.0]) -> None:
         
         r'''Init method.'''
             
         super().__init__('casey2012')
             
-        self.temperature = ListFloatProperty(temperature, minBound=0.0)
-        self.beta        = ListFloatProperty(beta,        minBound=0.0)
-        self.alpha       = ListFloatProperty(alpha,       minBound=0.0)
+        self._setProperties(locals())
             
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[casey2012]]
-          # Temperature of the dust in K.
-          temperature = {self.temperature}
-          # Emissivity index of the dust.
-          beta = {self.beta}
-          # Mid-infrared powerlaw slope.
-          alpha = {self.alpha}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1584,8 +2136,15 @@ class DALEmodule(DUSTmodule):
     :param list alpha: (**Optional**) mid-infrared powerlaw slope
     '''
     
-    def __init__(self, fracAGN: List[float] = [0.0],
-                 alpha: List[float]         = [2.0]) -> None:
+    __slots__ = ('fracAGN', 'alpha')
+    
+    _SECTION = 'dale2014'
+    _FIELDS  = (('fracAGN', 'AGN fraction. It is not recommended to combine this AGN emission with the of Fritz et al. (2006) models.'),
+                ('alpha',   'Alpha slope. Possible values are: 0.0625, 0.1250, 0.1875, 0.2500, 0.3125, 0.3750, 0.4375, 0.5000, 0.5625, 0.6250, 0.6875, 0.7500, 0.8125, 0.8750, 0.9375, 1.0000, 1.0625, 1.1250, 1.1875, 1.2500, 1.3125, 1.3750, 1.4375, 1.5000, 1.5625, 1.6250, 1.6875, 1.7500, 1.8125, 1.8750, 1.9375, 2.0000, 2.0625, 2.1250, 2.1875, 2.2500, 2.3125, 2.3750, 2.4375, 2.5000, 2.5625, 2.6250, 2.6875, 2.7500, 2.8125, 2.8750, 2.9375, 3.0000, 3.0625, 3.1250, 3.1875, 3.2500, 3.3125, 3.3750, 3.4375, 3.5000, 3.5625, 3.6250, 3.6875, 3.7500, 3.8125, 3.8750, 3.9375, 4.0000')
+               )
+    
+    def __init__(self, fracAGN: list[float] = [0.0],
+                 alpha: list[float]         = [2.0]) -> None:
     
         r'''Init method.'''
         
@@ -1601,35 +2160,9 @@ class DALEmodule(DUSTmodule):
         
         self.fracAGN = ListFloatProperty(fracAGN, minBound=0.0,    maxBound=1.0)
         self.alpha   = ListFloatProperty(alpha,   minBound=0.0625, maxBound=4.0,
-                                         testFunc=lambda value: any((i not in alphaRange for i in value)),
+                                         testFunc=_optionTest(alphaRange),
                                          testMsg=f'One on the alpha values is not accepted. Accepted values must be in the list {alphaRange}.')
         
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[dale2014]]
-          # AGN fraction. It is not recommended to combine this AGN emission with
-          # the of Fritz et al. (2006) models.
-          fracAGN = {self.fracAGN}
-          # Alpha slope. Possible values are: 0.0625, 0.1250, 0.1875, 0.2500,
-          # 0.3125, 0.3750, 0.4375, 0.5000, 0.5625, 0.6250, 0.6875, 0.7500,
-          # 0.8125, 0.8750, 0.9375, 1.0000, 1.0625, 1.1250, 1.1875, 1.2500,
-          # 1.3125, 1.3750, 1.4375, 1.5000, 1.5625, 1.6250, 1.6875, 1.7500,
-          # 1.8125, 1.8750, 1.9375, 2.0000, 2.0625, 2.1250, 2.1875, 2.2500,
-          # 2.3125, 2.3750, 2.4375, 2.5000, 2.5625, 2.6250, 2.6875, 2.7500,
-          # 2.8125, 2.8750, 2.9375, 3.0000, 3.0625, 3.1250, 3.1875, 3.2500,
-          # 3.3125, 3.3750, 3.4375, 3.5000, 3.5625, 3.6250, 3.6875, 3.7500,
-          # 3.8125, 3.8750, 3.9375, 4.0000
-          alpha = {self.alpha}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1658,10 +2191,19 @@ class DL07module(DUSTmodule):
     :param list gamma: (**Optional**) fraction illuminated from Umin to Umax. Possible values between 0 and 1.
     '''
     
-    def __init__(self, qpah: List[float] = [2.5],
-                 umin: List[float]       = [1.0],
-                 umax: List[float]       = [1000000.0],
-                 gamma: List[float]      = [0.1],) -> None:
+    __slots__ = ('qpah', 'umin', 'umax', 'gamma')
+    
+    _SECTION = 'dl2007'
+    _FIELDS  = (('qpah',  'Mass fraction of PAH. Possible values are: 0.47, 1.12, 1.77, 2.50, 3.19, 3.90, 4.58.'),
+                ('umin',  'Minimum radiation field. Possible values are: 0.10, 0.15, 0.20, 0.30, 0.40, 0.50, 0.70, 0.80, 1.00, 1.20, 1.50, 2.00, 2.50, 3.00, 4.00, 5.00, 7.00, 8.00, 10.0, 12.0, 15.0, 20.0, 25.0.'),
+                ('umax',  'Maximum radiation field. Possible values are: 1e3, 1e4, 1e5, 1e6.'),
+                ('gamma', 'Fraction illuminated from Umin to Umax. Possible values between 0 and 1.')
+               )
+    
+    def __init__(self, qpah: list[float] = [2.5],
+                 umin: list[float]       = [1.0],
+                 umax: list[float]       = [1000000.0],
+                 gamma: list[float]      = [0.1],) -> None:
     
         r'''Init method.'''
         
@@ -1677,47 +2219,22 @@ class DL07module(DUSTmodule):
         # Accepted values for umax
         umaxRange = [1e3, 1e4, 1e5, 1e6]
         
-        self.qpah: List[float]  = ListFloatProperty(qpah, minBound=0.47, maxBound=4.58,
-                                                    testFunc=lambda value: any((i not in qpahRange for i in value)),
+        self.qpah: list[float]  = ListFloatProperty(qpah, minBound=0.47, maxBound=4.58,
+                                                    testFunc=_optionTest(qpahRange),
                                                     testMsg=f'One on the qpah values is not accepted. Accepted values must be in the list {qpahRange}.')
         
         
-        self.umin: List[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=25.0,
-                                                    testFunc=lambda value: any((i not in uminRange for i in value)),
+        self.umin: list[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=25.0,
+                                                    testFunc=_optionTest(uminRange),
                                                     testMsg=f'One on the umin values is not accepted. Accepted values must be in the list {uminRange}.')
         
         
-        self.umax: List[float]  = ListFloatProperty(umax, minBound=1e3, maxBound=1e6,
-                                                    testFunc=lambda value: any((i not in umaxRange for i in value)),
+        self.umax: list[float]  = ListFloatProperty(umax, minBound=1e3, maxBound=1e6,
+                                                    testFunc=_optionTest(umaxRange),
                                                     testMsg=f'One on the umax values is not accepted. Accepted values must be in the list {umaxRange}.')
         
-        self.gamma: List[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
-        
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[dl2007]]
-          # Mass fraction of PAH. Possible values are: 0.47, 1.12, 1.77, 2.50,
-          # 3.19, 3.90, 4.58.
-          qpah = {self.qpah}
-          # Minimum radiation field. Possible values are: 0.10, 0.15, 0.20, 0.30,
-          # 0.40, 0.50, 0.70, 0.80, 1.00, 1.20, 1.50, 2.00, 2.50, 3.00, 4.00,
-          # 5.00, 7.00, 8.00, 10.0, 12.0, 15.0, 20.0, 25.0.
-          umin = {self.umin}
-          # Maximum radiation field. Possible values are: 1e3, 1e4, 1e5, 1e6.
-          umax = {self.umax}
-          # Fraction illuminated from Umin to Umax. Possible values between 0 and
-          # 1.
-          gamma = {self.gamma}
-        '''
+        self.gamma: list[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
         
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1748,10 +2265,19 @@ class DL14module(DUSTmodule):
     :param list gamma: (**Optional**) fraction illuminated from Umin to Umax. Possible values between 0 and 1.
     '''
     
-    def __init__(self, qpah: List[float] = [2.5],
-                 umin: List[float]       = [1.0],
-                 gamma: List[float]      = [0.1],
-                 alpha: List[float]      = [2.0]) -> None:
+    __slots__ = ('qpah', 'umin', 'alpha', 'gamma')
+    
+    _SECTION = 'dl2014'
+    _FIELDS  = (('qpah',  'Mass fraction of PAH. Possible values are: 0.47, 1.12, 1.77, 2.50, 3.19, 3.90, 4.58, 5.26, 5.95, 6.63, 7.32.'),
+                ('umin',  'Minimum radiation field. Possible values are: 0.100, 0.120, 0.150, 0.170, 0.200, 0.250, 0.300, 0.350, 0.400, 0.500, 0.600, 0.700, 0.800, 1.000, 1.200, 1.500, 1.700, 2.000, 2.500, 3.000, 3.500, 4.000, 5.000, 6.000, 7.000, 8.000, 10.00, 12.00, 15.00, 17.00, 20.00, 25.00, 30.00, 35.00, 40.00, 50.00.'),
+                ('alpha', 'Powerlaw slope dU/dM propto U^alpha. Possible values are: 1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3.0.'),
+                ('gamma', 'Fraction illuminated from Umin to Umax. Possible values between 0 and 1.')
+               )
+    
+    def __init__(self, qpah: list[float] = [2.5],
+                 umin: list[float]       = [1.0],
+                 gamma: list[float]      = [0.1],
+                 alpha: list[float]      = [2.0]) -> None:
     
         r'''Init method.'''
         
@@ -1768,50 +2294,21 @@ class DL14module(DUSTmodule):
         # Accepted values for alpha
         alphaRange = [1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3.0]
         
-        self.qpah: List[float]  = ListFloatProperty(qpah, minBound=0.47, maxBound=7.32,
-                                                    testFunc=lambda value: any((i not in qpahRange for i in value)),
+        self.qpah: list[float]  = ListFloatProperty(qpah, minBound=0.47, maxBound=7.32,
+                                                    testFunc=_optionTest(qpahRange),
                                                     testMsg=f'One on the qpah values is not accepted. Accepted values must be in the list {qpahRange}.')
         
         
-        self.umin: List[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=50.0,
-                                                    testFunc=lambda value: any((i not in uminRange for i in value)),
+        self.umin: list[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=50.0,
+                                                    testFunc=_optionTest(uminRange),
                                                     testMsg=f'One on the umin values is not accepted. Accepted values must be in the list {uminRange}.')
         
-        self.alpha: List[float] = ListFloatProperty(alpha, minBound=1.0, maxBound=3.0,
-                                                    testFunc=lambda value: any((i not in alphaRange for i in value)),
+        self.alpha: list[float] = ListFloatProperty(alpha, minBound=1.0, maxBound=3.0,
+                                                    testFunc=_optionTest(alphaRange),
                                                     testMsg=f'One on the alpha values is not accepted. Accepted values must be in the list {alphaRange}.')
         
-        self.gamma: List[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
-        
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[dl2014]]
-          # Mass fraction of PAH. Possible values are: 0.47, 1.12, 1.77, 2.50,
-          # 3.19, 3.90, 4.58, 5.26, 5.95, 6.63, 7.32.
-          qpah = {self.qpah}
-          # Minimum radiation field. Possible values are: 0.100, 0.120, 0.150,
-          # 0.170, 0.200, 0.250, 0.300, 0.350, 0.400, 0.500, 0.600, 0.700, 0.800,
-          # 1.000, 1.200, 1.500, 1.700, 2.000, 2.500, 3.000, 3.500, 4.000, 5.000,
-          # 6.000, 7.000, 8.000, 10.00, 12.00, 15.00, 17.00, 20.00, 25.00, 30.00,
-          # 35.00, 40.00, 50.00.
-          umin = {self.umin}
-          # Powerlaw slope dU/dM propto U^alpha. Possible values are: 1.0, 1.1,
-          # 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5,
-          # 2.6, 2.7, 2.8, 2.9, 3.0.
-          alpha = {self.alpha}
-          # Fraction illuminated from Umin to Umax. Possible values between 0 and
-          # 1.
-          gamma = {self.gamma}
-        '''
+        self.gamma: list[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
         
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1842,10 +2339,19 @@ class THEMISmodule(DUSTmodule):
     :param list gamma: (**Optional**) fraction illuminated from Umin to Umax. Possible values between 0 and 1.
     '''
     
-    def __init__(self, qhac: List[float] = [0.17],
-                 umin: List[float]       = [1.0],
-                 gamma: List[float]      = [0.1],
-                 alpha: List[float]      = [2.0]) -> None:
+    __slots__ = ('qhac', 'umin', 'alpha', 'gamma')
+    
+    _SECTION = 'themis'
+    _FIELDS  = (('qhac',  'Mass fraction of hydrocarbon solids i.e., a-C(:H) smaller than 1.5 nm, also known as HAC. Possible values are: 0.02, 0.06, 0.10, 0.14, 0.17, 0.20, 0.24, 0.28, 0.32, 0.36, 0.40.'),
+                ('umin',  'Minimum radiation field. Possible values are: 0.100, 0.120, 0.150, 0.170, 0.200, 0.250, 0.300, 0.350, 0.400, 0.500, 0.600, 0.700, 0.800, 1.000, 1.200, 1.500, 1.700, 2.000, 2.500, 3.000, 3.500, 4.000, 5.000, 6.000, 7.000, 8.000, 10.00, 12.00, 15.00, 17.00, 20.00, 25.00, 30.00, 35.00, 40.00, 50.00, 80.00.'),
+                ('alpha', 'Powerlaw slope dU/dM propto U^alpha. Possible values are: 1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3.0.'),
+                ('gamma', 'Fraction illuminated from Umin to Umax. Possible values between 0 and 1.')
+               )
+    
+    def __init__(self, qhac: list[float] = [0.17],
+                 umin: list[float]       = [1.0],
+                 gamma: list[float]      = [0.1],
+                 alpha: list[float]      = [2.0]) -> None:
     
         r'''Init method.'''
         
@@ -1862,51 +2368,21 @@ class THEMISmodule(DUSTmodule):
         # Accepted values for alpha
         alphaRange = [1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3.0]
         
-        self.qhac: List[float]  = ListFloatProperty(qhac, minBound=0.02, maxBound=0.4,
-                                                    testFunc=lambda value: any((i not in qhacRange for i in value)),
+        self.qhac: list[float]  = ListFloatProperty(qhac, minBound=0.02, maxBound=0.4,
+                                                    testFunc=_optionTest(qhacRange),
                                                     testMsg=f'One on the qhac values is not accepted. Accepted values must be in the list {qhacRange}.')
         
         
-        self.umin: List[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=80.0,
-                                                    testFunc=lambda value: any((i not in uminRange for i in value)),
+        self.umin: list[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=80.0,
+                                                    testFunc=_optionTest(uminRange),
                                                     testMsg=f'One on the umin values is not accepted. Accepted values must be in the list {uminRange}.')
         
-        self.alpha: List[float] = ListFloatProperty(alpha, minBound=1.0, maxBound=3.0,
-                                                    testFunc=lambda value: any((i not in alphaRange for i in value)),
+        self.alpha: list[float] = ListFloatProperty(alpha, minBound=1.0, maxBound=3.0,
+                                                    testFunc=_optionTest(alphaRange),
                                                     testMsg=f'One on the alpha values is not accepted. Accepted values must be in the list {alphaRange}.')
         
-        self.gamma: List[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
-        
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[themis]]
-          # Mass fraction of hydrocarbon solids i.e., a-C(:H) smaller than 1.5 nm,
-          # also known as HAC. Possible values are: 0.02, 0.06, 0.10, 0.14, 0.17,
-          # 0.20, 0.24, 0.28, 0.32, 0.36, 0.40.
-          qhac = {self.qhac}
-          # Minimum radiation field. Possible values are: 0.100, 0.120, 0.150,
-          # 0.170, 0.200, 0.250, 0.300, 0.350, 0.400, 0.500, 0.600, 0.700, 0.800,
-          # 1.000, 1.200, 1.500, 1.700, 2.000, 2.500, 3.000, 3.500, 4.000, 5.000,
-          # 6.000, 7.000, 8.000, 10.00, 12.00, 15.00, 17.00, 20.00, 25.00, 30.00,
-          # 35.00, 40.00, 50.00, 80.00.
-          umin = {self.umin}
-          # Powerlaw slope dU/dM propto U^alpha. Possible values are: 1.0, 1.1,
-          # 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5,
-          # 2.6, 2.7, 2.8, 2.9, 3.0.
-          alpha = {self.alpha}
-          # Fraction illuminated from Umin to Umax. Possible values between 0 and
-          # 1.
-          gamma = {self.gamma}
-        '''
+        self.gamma: list[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
         
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -1929,7 +2405,7 @@ class THEMISmodule(DUSTmodule):
 #        AGN        #
 #####################
 
-class AGNmodule(ABC):
+class AGNmodule(CigaleModule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -1939,7 +2415,9 @@ class AGNmodule(ABC):
     :param list fracAGN: (**Optional**) AGN fraction
     '''
     
-    def __init__(self, name, fracAGN: List[float] = [0.1], **kwargs) -> None:
+    __slots__ = ('name', 'fracAGN')
+    
+    def __init__(self, name, fracAGN: list[float] = [0.1], **kwargs) -> None:
         r'''Init method.'''
         
         self.name    = name
@@ -1947,27 +2425,6 @@ class AGNmodule(ABC):
         
         return
         
-    @abstractmethod
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        return
-    
-    @property
-    @abstractmethod
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        return
-
 class FRITZmodule(AGNmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
@@ -1983,13 +2440,25 @@ class FRITZmodule(AGNmodule):
     :param list fracAGN: (**Optional**) AGN fraction
     '''
     
-    def __init__(self, r_ratio: List[int] = [60.0],
-                 tau: List[float]         = [1.0],
-                 beta: List[float]        = [-0.5],
-                 gamma: List[int]         = [4],
-                 opening_angle: List[int] = [100],
-                 psy: List[float]         = [50.1],
-                 fracAGN: List[float]     = [0.1]) -> None:
+    __slots__ = ('r_ratio', 'tau', 'beta', 'gamma', 'opening_angle', 'psy')
+    
+    _SECTION = 'fritz2006'
+    _FIELDS  = (('r_ratio',       'Ratio of the maximum to minimum radii of the dust torus. Possible values are: 10, 30, 60, 100, 150.'),
+                ('tau',           'Optical depth at 9.7 microns. Possible values are: 0.1, 0.3, 0.6, 1.0, 2.0, 3.0, 6.0, 10.0.'),
+                ('beta',          'Beta. Possible values are: -1.00, -0.75, -0.50, -0.25, 0.00.'),
+                ('gamma',         'Gamma. Possible values are: 0.0, 2.0, 4.0, 6.0.'),
+                ('opening_angle', 'Full opening angle of the dust torus (Fig 1 of Fritz 2006). Possible values are: 60., 100., 140.'),
+                ('psy',           'Angle between equatorial axis and line of sight. Psy = 90◦ for type 1 and Psy = 0° for type 2. Possible values are: 0.001, 10.100, 20.100, 30.100, 40.100, 50.100, 60.100, 70.100, 80.100, 89.990.'),
+                ('fracAGN',       'AGN fraction.')
+               )
+    
+    def __init__(self, r_ratio: list[int] = [60.0],
+                 tau: list[float]         = [1.0],
+                 beta: list[float]        = [-0.5],
+                 gamma: list[int]         = [4],
+                 opening_angle: list[int] = [100],
+                 psy: list[float]         = [50.1],
+                 fracAGN: list[float]     = [0.1]) -> None:
         
         r'''Init method.'''
         
@@ -2015,62 +2484,30 @@ class FRITZmodule(AGNmodule):
         
         
         self.r_ratio       = ListFloatProperty(r_ratio, minBound=10, maxBound=150,
-                                               testFunc=lambda value: any((i not in r_ratioRange for i in value)),
+                                               testFunc=_optionTest(r_ratioRange),
                                                testMsg=f'One on the r_ratio values is not accepted. Accepted values must be in the list {r_ratioRange}.')
         
         
         self.tau           = ListFloatProperty(tau, minBound=0.1, maxBound=10.0,
-                                               testFunc=lambda value: any((i not in tauRange for i in value)),
+                                               testFunc=_optionTest(tauRange),
                                                testMsg=f'One on the tau values is not accepted. Accepted values must be in the list {tauRange}.')
         
         self.beta          = ListFloatProperty(beta, minBound=-1.0, maxBound=0.0,
-                                               testFunc=lambda value: any((i not in betaRange for i in value)),
+                                               testFunc=_optionTest(betaRange),
                                                testMsg=f'One on the beta values is not accepted. Accepted values must be in the list {betaRange}.')
         
         self.gamma         = ListFloatProperty(gamma, minBound=0, maxBound=6,
-                                               testFunc=lambda value: any((i not in gammaRange for i in value)),
+                                               testFunc=_optionTest(gammaRange),
                                                testMsg=f'One on the gamma values is not accepted. Accepted values must be in the list {gammaRange}.')
         
         self.opening_angle = ListFloatProperty(opening_angle, minBound=60, maxBound=140,
-                                               testFunc=lambda value: any((i not in opening_angleRange for i in value)),
+                                               testFunc=_optionTest(opening_angleRange),
                                                testMsg=f'One on the opening_angle values is not accepted. Accepted values must be in the list {opening_angleRange}.')
         
         self.psy           = ListFloatProperty(psy, minBound=0.001, maxBound=89.99,
-                                               testFunc=lambda value: any((i not in psyRange for i in value)),
+                                               testFunc=_optionTest(psyRange),
                                                testMsg=f'One on the psy values is not accepted. Accepted values must be in the list {psyRange}.')
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[fritz2006]]
-          # Ratio of the maximum to minimum radii of the dust torus. Possible
-          # values are: 10, 30, 60, 100, 150.
-          r_ratio = {self.r_ratio}
-          # Optical depth at 9.7 microns. Possible values are: 0.1, 0.3, 0.6, 1.0,
-          # 2.0, 3.0, 6.0, 10.0.
-          tau = {self.tau}
-          # Beta. Possible values are: -1.00, -0.75, -0.50, -0.25, 0.00.
-          beta = {self.beta}
-          # Gamma. Possible values are: 0.0, 2.0, 4.0, 6.0.
-          gamma = {self.gamma}
-          # Full opening angle of the dust torus (Fig 1 of Fritz 2006). Possible
-          # values are: 60., 100., 140.
-          opening_angle = {self.opening_angle}
-          # Angle between equatorial axis and line of sight. Psy = 90◦ for type 1
-          # and Psy = 0° for type 2. Possible values are: 0.001, 10.100, 20.100,
-          # 30.100, 40.100, 50.100, 60.100, 70.100, 80.100, 89.990.
-          psy = {self.psy}
-          # AGN fraction.
-          fracAGN = {self.fracAGN}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -2108,14 +2545,27 @@ class SKIRTORmodule(AGNmodule):
     :param list fracAGN: (**Optional**) AGN fraction
     '''
     
-    def __init__(self, t: List[int]   = [3],
-                 pl: List[float]      = [1.0],
-                 q: List[float]       = [1.0],
-                 oa: List[int]        = [40],
-                 R: List[int]         = [20],
-                 Mcl: List[float]     = [0.97],
-                 i: List[int]         = [40],
-                 fracAGN: List[float] = [0.1]) -> None:
+    __slots__ = ('t', 'pl', 'q', 'oa', 'R', 'Mcl', 'i')
+    
+    _SECTION = 'skirtor2016'
+    _FIELDS  = (('t',       'Average edge-on optical depth at 9.7 micron; the actual one alongthe line of sight may vary depending on the clumps distribution. Possible values are: 3, 5, 7, 8, and 11.'),
+                ('pl',      'Power-law exponent that sets radial gradient of dust density.Possible values are: 0., 0.5, 1., and 1.5.'),
+                ('q',       'Index that sets dust density gradient with polar angle.Possible values are:  0., 0.5, 1., and 1.5.'),
+                ('oa',      'Angle measured between the equatorial plan and edge of the torus. Half-opening angle of the dust-free cone is 90-oaPossible values are: 10, 20, 30, 40, 50, 60, 70, and 80'),
+                ('R',       'Ratio of outer to inner radius, R_out/R_in.Possible values are: 10, 20, and 30'),
+                ('Mcl',     'fraction of total dust mass inside clumps. 0.97 means 97% of total mass is inside the clumps and 3% in the interclump dust. Possible values are: 0.97.'),
+                ('i',       'inclination, i.e. viewing angle, i.e. position of the instrument w.r.t. the AGN axis. i=0: face-on, type 1 view; i=90: edge-on, type 2 view.Possible values are: 0, 10, 20, 30, 40, 50, 60, 70, 80, and 90.'),
+                ('fracAGN', 'AGN fraction.')
+               )
+    
+    def __init__(self, t: list[int]   = [3],
+                 pl: list[float]      = [1.0],
+                 q: list[float]       = [1.0],
+                 oa: list[int]        = [40],
+                 R: list[int]         = [20],
+                 Mcl: list[float]     = [0.97],
+                 i: list[int]         = [40],
+                 fracAGN: list[float] = [0.1]) -> None:
         
         r'''Init method.'''
         
@@ -2141,74 +2591,34 @@ class SKIRTORmodule(AGNmodule):
         
         
         self.t   =  ListIntProperty(t, minBound=3, maxBound=11,
-                                    testFunc=lambda value: any((i not in tRange for i in value)),
+                                    testFunc=_optionTest(tRange),
                                     testMsg=f'One on the t values is not accepted. Accepted values must be in the list {tRange}.')
         
         
         self.pl   = ListFloatProperty(pl, minBound=0.0, maxBound=1.5,
-                                      testFunc=lambda value: any((i not in pl_qRange for i in value)),
+                                      testFunc=_optionTest(pl_qRange),
                                       testMsg=f'One on the pl values is not accepted. Accepted values must be in the list {pl_qRange}.')
         
         self.q    = ListFloatProperty(q, minBound=0.0, maxBound=1.5,
-                                      testFunc=lambda value: any((i not in pl_qRange for i in value)),
+                                      testFunc=_optionTest(pl_qRange),
                                       testMsg=f'One on the q values is not accepted. Accepted values must be in the list {pl_qRange}.')
         
         self.oa   = ListIntProperty(oa, minBound=10, maxBound=80,
-                                    testFunc=lambda value: any((i not in oaRange for i in value)),
+                                    testFunc=_optionTest(oaRange),
                                     testMsg=f'One on the oa values is not accepted. Accepted values must be in the list {oaRange}.')
         
         self.R    = ListFloatProperty(R, minBound=10, maxBound=30,
-                                      testFunc=lambda value: any((i not in RRange for i in value)),
+                                      testFunc=_optionTest(RRange),
                                       testMsg=f'One on the R values is not accepted. Accepted values must be in the list {RRange}.')
         
         self.Mcl  = ListFloatProperty(Mcl, minBound=0.97, maxBound=0.97,
-                                      testFunc=lambda value: any((i not in MclRange for i in value)),
+                                      testFunc=_optionTest(MclRange),
                                       testMsg=f'One on the Mcl values is not accepted. Accepted values must be in the list {MclRange}.')
         
         self.i    = ListIntProperty(i, minBound=0, maxBound=90,
-                                    testFunc=lambda value: any((i not in iRange for i in value)),
+                                    testFunc=_optionTest(iRange),
                                     testMsg=f'One on the i values is not accepted. Accepted values must be in the list {iRange}.')
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[skirtor2016]]
-          # Average edge-on optical depth at 9.7 micron; the actual one alongthe
-          # line of sight may vary depending on the clumps distribution. Possible
-          # values are: 3, 5, 7, 8, and 11.
-          t = {self.ts}
-          # Power-law exponent that sets radial gradient of dust density.Possible
-          # values are: 0., 0.5, 1., and 1.5.
-          pl = {self.pl}
-          # Index that sets dust density gradient with polar angle.Possible values
-          # are:  0., 0.5, 1., and 1.5.
-          q = {self.q}
-          # Angle measured between the equatorial plan and edge of the torus.
-          # Half-opening angle of the dust-free cone is 90-oaPossible values are:
-          # 10, 20, 30, 40, 50, 60, 70, and 80
-          oa = {self.oa}
-          # Ratio of outer to inner radius, R_out/R_in.Possible values are: 10,
-          # 20, and 30
-          R = {self.R}
-          # fraction of total dust mass inside clumps. 0.97 means 97% of total
-          # mass is inside the clumps and 3% in the interclump dust. Possible
-          # values are: 0.97.
-          Mcl = {self.Mcl}
-          # inclination, i.e. viewing angle, i.e. position of the instrument
-          # w.r.t. the AGN axis. i=0: face-on, type 1 view; i=90: edge-on, type 2
-          # view.Possible values are: 0, 10, 20, 30, 40, 50, 60, 70, 80, and 90.
-          i = {self.i}
-          # AGN fraction.
-          fracAGN = {self.fracAGN}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -2235,7 +2645,7 @@ class SKIRTORmodule(AGNmodule):
 #        Radio        #
 #######################
 
-class RADIOmodule:
+class RADIOmodule(CigaleModule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -2245,8 +2655,15 @@ class RADIOmodule:
     :param list alpha: (**Optional**) the slope of the power-law synchrotron emission
     '''
     
-    def __init__(self, qir: List[float] = [2.58],
-                 alpha: List[float]     = [0.8]) -> None:
+    __slots__ = ('name', 'qir', 'alpha')
+    
+    _SECTION = 'radio'
+    _FIELDS  = (('qir',   'The value of the FIR/radio correlation coefficient.'),
+                ('alpha', 'The slope of the power-law synchrotron emission.')
+               )
+    
+    def __init__(self, qir: list[float] = [2.58],
+                 alpha: list[float]     = [0.8]) -> None:
         
         r'''Init method.'''
         
@@ -2254,23 +2671,6 @@ class RADIOmodule:
         self.qir   = ListFloatProperty(qir, minBound=0.0)
         self.alpha = ListFloatProperty(alpha)
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[radio]]
-          # The value of the FIR/radio correlation coefficient.
-          qir = {self.qir}
-          # The slope of the power-law synchrotron emission.
-          alpha = {self.alpha}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -2291,7 +2691,7 @@ class RADIOmodule:
 #        Rest-frame parameters        #
 #######################################
 
-class RESTFRAMEmodule:
+class RESTFRAMEmodule(CigaleModule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -2304,6 +2704,17 @@ class RESTFRAMEmodule:
     :param str colours_filters: (**Optional**) rest-frame colours to be computed. You can give several colours separated by a & (don't use commas).
     '''
     
+    __slots__ = ('name', 'beta_calz94', 'D4000', 'IRX', 'EW_lines', 'luminosity_filters', 'colours_filters')
+    
+    _SECTION = 'restframe_parameters'
+    _FIELDS  = (('beta_calz94',        'UV slope measured in the same way as in Calzetti et al. (1994).'),
+                ('D4000',              'D4000 break using the Balogh et al. (1999) definition.'),
+                ('IRX',                'IRX computed from the GALEX FUV filter and the dust luminosity.'),
+                ('EW_lines',           "Central wavelength of the emission lines for which to compute the equivalent width. The half-bandwidth must be indicated after the '/' sign. For instance 656.3/1.0 means oth the nebular line and the continuum are integrated over 655.3-657.3 nm."),
+                ('luminosity_filters', "Filters for which the rest-frame luminosity will be computed. You can give several filter names separated by a & (don't use commas)."),
+                ('colours_filters',    "Rest-frame colours to be computed. You can give several colours separated by a & (don't use commas).")
+               )
+    
     def __init__(self, beta_calz94: bool = False,
                  D4000: bool             = False,
                  IRX: bool               = False,
@@ -2342,36 +2753,6 @@ class RESTFRAMEmodule:
         self.luminosity_filters = StrProperty(luminosity_filters)
         self.colours_filters    = StrProperty(colours_filters)
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[restframe_parameters]]
-          # UV slope measured in the same way as in Calzetti et al. (1994).
-          beta_calz94 = {self.beta_calz94}
-          # D4000 break using the Balogh et al. (1999) definition.
-          D4000 = {self.D4000}
-          # IRX computed from the GALEX FUV filter and the dust luminosity.
-          IRX = {self.IRX}
-          # Central wavelength of the emission lines for which to compute the
-          # equivalent width. The half-bandwidth must be indicated after the '/'
-          # sign. For instance 656.3/1.0 means oth the nebular line and the
-          # continuum are integrated over 655.3-657.3 nm.
-          EW_lines = {self.EW_lines}
-          # Filters for which the rest-frame luminosity will be computed. You can
-          # give several filter names separated by a & (don't use commas).
-          luminosity_filters = {self.luminosity_filters}
-          # Rest-frame colours to be computed. You can give several colours
-          # separated by a & (don't use commas).
-          colours_filters = {self.colours_filters}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
@@ -2396,7 +2777,7 @@ class RESTFRAMEmodule:
 #        Redshifting        #
 #############################
 
-class REDSHIFTmodule:
+class REDSHIFTmodule(CigaleModule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -2405,7 +2786,13 @@ class REDSHIFTmodule:
     :param list redshift: redshift of the objects. Leave empty to use the redshifts from the input file.
     '''
     
-    def __init__(self, redshift: List[float] = []) -> None:
+    __slots__ = ('name', 'redshift')
+    
+    _SECTION = 'redshifting'
+    _FIELDS  = (('redshift', 'Redshift of the objects. Leave empty to use the redshifts from the input file.'),
+               )
+    
+    def __init__(self, redshift: list[float] = []) -> None:
         
         r'''Init method.'''
         
@@ -2417,22 +2804,6 @@ class REDSHIFTmodule:
             self.redshift = ListFloatProperty(redshift, minBound=0.0)
             
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[redshifting]]
-          # Redshift of the objects. Leave empty to use the redshifts from the
-          # input file.
-          redshift = {self.redshift}
-        '''
-        
-        return text
-    
     @property
     def spec(self, *args, **kwargs) -> str:
         r'''
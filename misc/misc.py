@@ -9,7 +9,7 @@ Miscellaneous, quite general objects used by the SED fitting classes.
 import numpy         as     np
 from   numpy         import ndarray
 from   astropy.units import Unit, Quantity
-from   typing        import Any
+from   typing        import Any, Tuple
 
 ##############################################
 #        Custom errors and exceptions        #
@@ -39,6 +39,41 @@ class ShapeError(Exception):
         super.__init__(f'Array 1 has shape {arr1.shape} but array 2 has shape {arr2.shape}{msg}.')
         
 
+##################################
+#        Custom functions        #
+##################################
+
+def maskBoundingBox(mask: ndarray) -> Tuple[int]:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+    
+    Compute the bounding box of the good pixels of a mask.
+    
+    :param mask: mask for bad pixels (:python:`True` for bad pixels, :python:`False` for good ones)
+    :type mask: `ndarray`_ [:python:`bool`]
+    
+    :returns: bounding box (ymin, ymax, xmin, xmax), upper bounds being excluded
+    :rtype: :python:`tuple[int]`
+    
+    :raises ValueError: if there is no good pixel in the mask
+    '''
+    
+    # Reductions along rows and columns avoid building the (large) arrays of indices of all the good pixels
+    good   = np.logical_not(mask)
+    rows   = good.any(axis=1)
+    cols   = good.any(axis=0)
+    
+    if not rows.any():
+        raise ValueError('Cannot compute the bounding box of a mask without any good pixel.')
+    
+    ymin   = int(np.argmax(rows))
+    ymax   = len(rows) - int(np.argmax(rows[::-1]))
+    xmin   = int(np.argmax(cols))
+    xmax   = len(cols) - int(np.argmax(cols[::-1]))
+    
+    return ymin, ymax, xmin, xmax
+    
+
 ###################################
 #        Custom decorators        #
 ###################################
@@ -65,7 +100,7 @@ def check_type(dtype):
                 raise ValueError('Cannot check type for data with length 0.')
             
             value = args[1]
-            if value != '-1' and not isinstance(value, dtype):
+            if not (isinstance(value, str) and value == '-1') and not isinstance(value, dtype):
                 raise TypeError(f'parameter has type {type(value)} but it must have type {dtype}.')
                 
             return func(*args, **kwargs)
@@ -6,6 +6,8 @@
 Property classes used in other parts of the code.
 """
 
+import numpy   as     np
+from   numpy   import ndarray
 from   abc     import ABC, abstractmethod
 from   typing  import Any, Callable, List, Optional
 from   enum    import Enum
@@ -39,8 +41,15 @@ class Property(ABC):
         * if **testMsg** is not of type :python:`str`
         
     :raises ValueError: if **minBound** is larger than **maxBound** and both are not :python:`None`
+    
+    .. note::
+        
+        The attribute :python:`changes` counts how many times the value of the property was set. Objects caching a text built from their properties can compare it to the counts they stored to know whether their text is outdated, without being affected by changes to other properties.
     '''
     
+    #: Number of times the value of the property was set (set on the instance at the first change)
+    changes: int = 0
+    
     def __init__(self, default: Any,
                  minBound: Optional[Any] = None, 
                  maxBound: Optional[Any] = None, 
@@ -65,6 +74,24 @@ class Property(ABC):
     #        Built-in methods        #
     ##################################
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+        
+        Set an attribute and count the change on the property if its value is set.
+        
+        :param name: name of the attribute
+        :type name: :python:`str`
+        :param value: new value of the attribute
+        '''
+        
+        object.__setattr__(self, name, value)
+        
+        if name == 'value':
+            object.__setattr__(self, 'changes', self.changes + 1)
+            
+        return
+    
     @abstractmethod
     def __str__(self, *args, **kwargs) -> str:
         r'''
@@ -450,7 +477,7 @@ class ListIntProperty(ListProperty):
     Define a property which stores an int list object.
     
     :param default: default value used at init
-    :type default: :python:`list[int]`
+    :type default: :python:`list[int]` or :python:`ndarray`
 
     :param minBound: (**Optional**) minimum value for the property. If :python:`None`, it is ignored.
     :type minBound: :python:`int`
@@ -488,18 +515,20 @@ class ListIntProperty(ListProperty):
         
         return ','.join([f'{i}' for i in self.value])
         
-    @check_type(list)
-    @check_type_in_list(int)
+    @check_type((list, ndarray))
+    @check_type_in_list((int, np.integer))
     def set(self, value: List[int], *args, **kwargs) -> None:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Set the current value.
+        Set the current value. It is stored as a contiguous :python:`np.int64` array.
 
         :param value: new value. Must be of correct type, and within bounds.
-        :type value: :python:`list[int]`
+        :type value: :python:`list[int]` or :python:`ndarray`
         '''
         
+        value      = np.asarray(value, dtype=np.int64)
+        
         self.check_bounds(value, self.min, self.max, self._testFunc, self._testMsg)
         self.value = value
         return
@@ -511,7 +540,7 @@ class ListFloatProperty(ListProperty):
     Define a property which stores an int list object.
     
     :param default: default value used at init
-    :type default: :python:`list[float]`
+    :type default: :python:`list[float]` or :python:`ndarray`
 
     :param minBound: (**Optional**) minimum value for the property. If :python:`None`, it is ignored.
     :type minBound: :python:`float`
@@ -549,18 +578,20 @@ class ListFloatProperty(ListProperty):
         
         return ','.join([f'{i:.3f}' if i == 0 or (i > 1e-3 and i < 1e3) else f'{i:.3e}' for i in self.value])
         
-    @check_type(list)
-    @check_type_in_list(float)
+    @check_type((list, ndarray))
+    @check_type_in_list((float, np.floating))
     def set(self, value: List[float], *args, **kwargs) -> None:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
         
-        Set the current value.
+        Set the current value. It is stored as a contiguous :python:`np.float64` array.
 
         :param value: new value. Must be of correct type, and within bounds.
-        :type value: :python:`list[float]`
+        :type value: :python:`list[float]` or :python:`ndarray`
         '''
         
+        value      = np.asarray(value, dtype=np.float64)
+        
         self.check_bounds(value, self.min, self.max, self._testFunc, self._testMsg)
         self.value = value
         return
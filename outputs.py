@@ -80,9 +80,10 @@ class Output(ABC):
       if not isinstance(filterList, FilterList):
          raise TypeError(f'filterList parameter has type {type(filterList)} but it must be of type FilterList.')
          
-      self.imProp['shape']   = filterList.shape
+      # Images are always built in the full frame, even if filters were cropped to a bounding box
+      self.imProp['shape']   = filterList.fullShape
       self.imProp['scale']   = filterList.scaleFac
-      self.imProp['meanMap'] = filterList.meanMap
+      self.imProp['meanMap'] = filterList.toFullFrame(filterList.meanMap, fill=0)
       
       return
   
@@ -151,7 +152,7 @@ class CigaleOutput(Output):
           raise TypeError(f'filterList parameter has type {type(filterList)} but it must be of type FilterList.')
           
        # Scale and meanMap are not used when generating the catalogue for cigale so no need to retrieve them
-       self.imProp['shape']   = filterList.shape
+       self.imProp['shape']   = filterList.fullShape
        
        return
 
@@ -209,12 +210,11 @@ class CigaleOutput(Output):
           shape        = self.imProp['shape']
        
        # Location of good pixels
-       indices         = self.table['id']
+       indices         = np.asarray(self.table['id'])
            
-       # Output array (NaN for bad pixels - default NaN everywhere)
-       data            = np.full(shape[0]*shape[1], np.nan)
-       data[indices]   = self.table[name]
-       data            = data.reshape(shape)
+       # Output array (NaN for bad pixels - default NaN everywhere) filled with a single scatter
+       data            = np.full(shape, np.nan)
+       data.flat[indices] = np.asarray(self.table[name])
        
        return Quantity(data, unit=self.units[name])
 
@@ -429,16 +429,16 @@ class LePhareOutput(Output):
          raise ValueError(f'meanMap has shape {meanMap.shape} but is must have shape {shape}.')
           
       # Location of good pixels
-      indices         = self.table['ID']
-          
-      # Output array (NaN for bad pixels - default NaN everywhere)
-      data            = np.full(shape[0]*shape[1], np.nan)
-      data[indices]   = self.table[name].data / scaleFactor
-      data            = data.reshape(shape)
+      indices         = np.asarray(self.table['ID'])
+      values          = self.table[name].data / scaleFactor
       
-      # Multiply by mean map only where it is non zero
+      # Multiply by mean map only where it is non zero (only good pixels are gathered from the mean map)
       if meanMap is not None:
-          mask        = meanMap != 0
-          data[mask] *= meanMap[mask]
+          norm        = meanMap.ravel()[indices]
+          values      = np.where(norm != 0, values * norm, values)
+          
+      # Output array (NaN for bad pixels - default NaN everywhere) filled with a single scatter
+      data            = np.full(shape, np.nan)
+      data.flat[indices] = values
       
       return Quantity(data, unit=self.table[name].unit)
\ No newline at end of file
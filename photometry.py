@@ -10,7 +10,7 @@ from   typing        import Union, Tuple
 import numpy         as     np
 import astropy.units as     u
 
-def countToMag(data: Union[float, np.ndarray], err: Union[float, np.ndarray], zeropoint: float) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+def countToMag(data: Union[float, np.ndarray], err: Union[float, np.ndarray], zeropoint: Union[float, np.ndarray]) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
     r'''
     .. codeauthor:: Hugo Plombat - LUPM <hugo.plombat@umontpellier.fr> & Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -30,8 +30,8 @@ def countToMag(data: Union[float, np.ndarray], err: Union[float, np.ndarray], ze
     :type data: :python:`float` or `ndarray`_ [:python:`float`]
     :param err: std errors in :math:`\rm{e^{-1}/s}`
     :type err: :python:`float` or `ndarray`_ [:python:`float`]
-    :param zeropoint: zeropoint associated to the data
-    :type zeropoint: :python:`float`
+    :param zeropoint: zeropoint associated to the data. An array of zeropoints broadcastable with **data** can be given to convert several filters at once.
+    :type zeropoint: :python:`float` or `ndarray`_ [:python:`float`]
     
     :returns: AB magnitude and associated error
     :rtype: (:python:`float` or `ndarray`_ [:python:`float`], :python:`float` or `ndarray`_ [:python:`float`]
@@ -42,7 +42,7 @@ def countToMag(data: Union[float, np.ndarray], err: Union[float, np.ndarray], ze
     
     return mag, emag
 
-def countToFlux(data: Union[float, np.ndarray], err: Union[float, np.ndarray], zeropoint: float) -> Tuple[u.Quantity, u.Quantity]:
+def countToFlux(data: Union[float, np.ndarray], err: Union[float, np.ndarray], zeropoint: Union[float, np.ndarray]) -> Tuple[u.Quantity, u.Quantity]:
     r'''
     .. codeauthor:: Hugo Plombat - LUPM <hugo.plombat@umontpellier.fr> & Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -52,8 +52,8 @@ def countToFlux(data: Union[float, np.ndarray], err: Union[float, np.ndarray], z
     :type data: :python:`float` or `ndarray`_ [:python:`float`]
     :param err: std errors in :math:`\rm{e^{-1}/s}`
     :type err: :python:`float` or `ndarray`_ [:python:`float`]
-    :param zeropoint: zeropoint associated to the data
-    :type zeropoint: :python:`float`
+    :param zeropoint: zeropoint associated to the data. An array of zeropoints broadcastable with **data** can be given to convert several filters at once.
+    :type zeropoint: :python:`float` or `ndarray`_ [:python:`float`]
     
     :returns: flux in :math:`\rm{erg/cm^2/s/Hz}` and associated error
     :rtype: (`Astropy Quantity`_, `Astropy Quantity`_)
@@ -280,18 +280,16 @@ class CigaleSED(SED):
         #: Redshifting modules to use
         self.redshifting: cigmod.REDSHIFTmodule    = self._checkModule(redshifting, cigmod.REDSHIFTmodule)
         
+        modules                                     = self.SFH + self.SSP + self.nebular + self.attenuation + self.dust + self.agn + self.radio + self.restframe + self.redshifting
+        
         #: Modules names list
-        self.moduleNames: ListStrProperty           = ListStrProperty([i.name for i in self.SFH + self.SSP + self.nebular + self.attenuation + self.dust + self.agn + self.radio + self.restframe + self.redshifting])
+        self.moduleNames: ListStrProperty           = ListStrProperty([i.name for i in modules])
         
         #: Modules parameters in str format
-        self.modulesStr: str                        = ''
+        self.modulesStr: str                        = f'\n{cigmod.renderConfig(*modules)}' if modules else ''
         
         #: Modules spec parameters in str format
-        self.modulesSpec: str                       = ''
-        
-        for pos, module in enumerate(self.SFH + self.SSP + self.nebular + self.attenuation + self.dust + self.agn + self.radio + self.restframe + self.redshifting):
-            self.modulesStr                        += f'\n\n{module}' if pos != 0 else f'\n{module}'
-            self.modulesSpec                       += indent(dedent(f'\n{module.spec}' if pos != 0 else f'{module.spec}'), '   ')
+        self.modulesSpec: str                       = ''.join([indent(dedent(f'\n{module.spec}' if pos != 0 else f'{module.spec}'), '   ') for pos, module in enumerate(modules)])
 
     @staticmethod
     def _checkModule(modules: List[Any], inheritedClass: Any) -> bool:
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+r"""
+.. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+
+Tests of the SED fitting parser library.
+
+.. note::
+
+    The library is registered as the SED package when the tests are imported, so that they run from a checkout whatever the name of its directory, e.g. with :python:`python -m unittest discover` from the root of the repository.
+"""
+
+import sys
+import os.path        as     opath
+from   importlib.util import spec_from_file_location, module_from_spec
+
+if 'SED' not in sys.modules:
+    
+    _root = opath.dirname(opath.dirname(opath.abspath(__file__)))
+    _spec = spec_from_file_location('SED', opath.join(_root, '__init__.py'), submodule_search_locations=[_root])
+    
+    sys.modules['SED'] = module_from_spec(_spec)
+    _spec.loader.exec_module(sys.modules['SED'])
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+r"""
+.. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+
+Tests of the Cigale modules.
+"""
+
+import json
+import os.path          as     opath
+import unittest
+import warnings
+import numpy            as     np
+
+from   SED.misc         import cigaleModules as cigmod
+
+#: Text of the modules built with their default parameters, rendered with the original (baseline) implementation of the modules
+with open(opath.join(opath.dirname(opath.abspath(__file__)), 'data', 'cigaleModules.json'), encoding='utf-8') as f:
+    BASELINE = json.load(f)
+
+class TestText(unittest.TestCase):
+    r'''Tests of the text written in Cigale parameter files.'''
+    
+    def test_same_as_baseline(self):
+        
+        for name, text in BASELINE.items():
+            with self.subTest(module=name):
+                module = getattr(cigmod, name)()
+                
+                self.assertEqual(str(module), text)
+                self.assertEqual(cigmod.renderConfig(module), text)
+    
+    def test_cf00_slopes(self):
+        
+        module = cigmod.DUSTATT_MODIFIED_CF00module(slope_ISM=[-0.7], slope_BC=[-1.3])
+        text   = str(module)
+        
+        self.assertTrue(hasattr(module, 'slope_BC'))
+        self.assertEqual(module.slope_ISM.value.tolist(), [-0.7])
+        self.assertEqual(module.slope_BC.value.tolist(),  [-1.3])
+        self.assertIn('slope_ISM = -7.000e-01', text)
+        self.assertIn('slope_BC = -1.300e+00',  text)
+
+class TestAttenuationBounds(unittest.TestCase):
+    r'''Tests of the bounds of the factors of the attenuation modules.'''
+    
+    def test_default_factors(self):
+        
+        for module, name in [(cigmod.DUSTATT_CALZLEITmodule, 'E_BVs_old_factor'), (cigmod.DUSTATT_MODIFIED_STARBUSTmodule, 'E_BV_factor')]:
+            with self.subTest(module=module.__name__):
+                
+                # Factors are accepted up to 1 as in the spec of the modules
+                self.assertEqual(getattr(module(), name).value.tolist(), [1.0] if module is cigmod.DUSTATT_CALZLEITmodule else [0.44])
+                self.assertEqual(getattr(module(**{name: [1.0]}), name).value.tolist(), [1.0])
+                
+                with self.assertRaises(ValueError):
+                    module(**{name: [1.5]})
+
+class TestTextCache(unittest.TestCase):
+    r'''Tests of the cached text of the modules.'''
+    
+    def test_other_modules_keep_cache(self):
+        
+        module = cigmod.DUSTATT_POWERLAWmodule()
+        text   = str(module)
+        
+        # Building and modifying other modules sets the value of their properties
+        other  = cigmod.SFHDELAYEDmodule()
+        other.tau_main.set([123])
+        
+        self.assertIs(str(module), text)
+    
+    def test_own_property_invalidates_cache(self):
+        
+        module = cigmod.DUSTATT_POWERLAWmodule()
+        text   = str(module)
+        module.Av_young.set([2.0])
+        
+        self.assertIn('Av_young = 2.000', str(module))
+        self.assertNotEqual(str(module), text)
+    
+    def test_attribute_invalidates_cache(self):
+        
+        module         = cigmod.DUSTATT_POWERLAWmodule()
+        str(module)
+        module.filters = cigmod.StrProperty('FUV')
+        
+        self.assertIn('filters = FUV', str(module))
+
+def _periodicReference(module, t):
+    r'''Vectorised SFR of the periodic SFH with one axis per burst, as first implemented in SFHPERIODICmodule.evaluate.'''
+    
+    type_bursts, delta_bursts, tau_bursts, age, sfr_A = module._grid(module.type_bursts, module.delta_bursts, module.tau_bursts, module.age, module.sfr_A)
+    
+    nb     = int(np.ceil(np.max(age / np.maximum(delta_bursts, 1))))
+    start  = delta_bursts * np.arange(nb)
+    active = (start < age)[:, np.newaxis, :]
+    dt     = t[:, np.newaxis] - start[:, np.newaxis, :]
+    tau    = tau_bursts[..., np.newaxis]
+    kind   = type_bursts[..., np.newaxis]
+    
+    with np.errstate(over='ignore'):
+        shape = np.select([kind == 0, kind == 1], 
+                          [np.exp(-dt / tau), dt * np.exp(-dt / tau) / tau**2], 
+                          default=(dt < tau).astype(float))
+    
+    sfr    = sfr_A * np.where(active & (dt >= 0), shape, 0.0).sum(axis=-1)
+    sfr[t >= age] = 0.0
+    
+    return module._normalised(sfr)
+
+class TestPeriodicSFH(unittest.TestCase):
+    r'''Tests of :py:meth:`~.SFHPERIODICmodule.evaluate`.'''
+    
+    t = np.arange(2000.0)
+    
+    def test_bursts(self):
+        
+        for normalise in [True, False]:
+            with self.subTest(normalise=normalise):
+                module = cigmod.SFHPERIODICmodule(type_bursts=[0, 1, 2], delta_bursts=[50, 300], tau_bursts=[1, 20, 100], age=[1000, 1500], normalise=normalise)
+                
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error')
+                    sfr = module.evaluate(self.t)
+                
+                self.assertTrue(np.isfinite(sfr).all())
+                np.testing.assert_allclose(sfr, _periodicReference(module, self.t), rtol=1e-12, atol=0)
+    
+    def test_zero_width_bursts(self):
+        
+        with self.assertRaises(ValueError):
+            cigmod.SFHPERIODICmodule(tau_bursts=[0])
+
+class TestModifiedStarburstIdentity(unittest.TestCase):
+    r'''Tests of the identity shortcut of :py:class:`~.DUSTATT_MODIFIED_STARBUSTmodule`.'''
+    
+    wavelength = np.linspace(100.0, 3000.0, 50)
+    fluxes     = np.random.default_rng(0).random((3, 50)).astype(np.float32)
+    
+    def test_null_colour_excess(self):
+        
+        for kwargs in [dict(E_BV_lines=[0.0]), dict(E_BV_factor=[0.0]), dict(E_BV_lines=[0.0], E_BV_factor=[0.0, 0.5])]:
+            with self.subTest(**kwargs):
+                module = cigmod.DUSTATT_MODIFIED_STARBUSTmodule(powerlaw_slope=[0.0, -0.5], **kwargs)
+                self.assertTrue(module.isIdentity)
+                
+                size   = module.attenuation(self.wavelength).shape[0]
+                fluxes = self.fluxes.copy()
+                out    = module.applyToMany(self.wavelength, fluxes)
+                
+                # Every combination returns a read-only view of the input which is left unchanged
+                np.testing.assert_array_equal(fluxes, self.fluxes)
+                self.assertEqual(out.shape, (size,) + fluxes.shape)
+                self.assertTrue(np.shares_memory(out, fluxes))
+                self.assertFalse(out.flags.writeable)
+                
+                for attenuated in out:
+                    np.testing.assert_array_equal(attenuated, fluxes)
+                
+                out    = module.apply(self.wavelength, fluxes[0])
+                self.assertEqual(out.shape, (size, fluxes.shape[1]))
+                self.assertTrue(np.shares_memory(out, fluxes))
+    
+    def test_null_colour_excess_double(self):
+        
+        module = cigmod.DUSTATT_MODIFIED_STARBUSTmodule(E_BV_lines=[0.0])
+        fluxes = self.fluxes.astype(np.float64)
+        out    = module.applyToMany(self.wavelength, fluxes)
+        
+        # Fluxes are converted once to single precision
+        self.assertEqual(out.dtype, np.float32)
+        np.testing.assert_array_equal(out[0], self.fluxes)
+    
+    def test_non_null_colour_excess(self):
+        
+        for kwargs in [dict(), dict(E_BV_lines=[0.0, 0.1]), dict(E_BV_factor=[0.0, 0.2])]:
+            with self.subTest(**kwargs):
+                module = cigmod.DUSTATT_MODIFIED_STARBUSTmodule(**kwargs)
+                self.assertFalse(module.isIdentity)
+                
+                out    = module.applyToMany(self.wavelength, self.fluxes)
+                self.assertTrue((out[-1] < self.fluxes).all())
+
+class TestStarburstCurveCache(unittest.TestCase):
+    r'''Tests of the cache of the modified starburst curves.'''
+    
+    def test_key_is_digest(self):
+        
+        module     = cigmod.DUSTATT_MODIFIED_STARBUSTmodule(uv_bump_amplitude=[0.0, 3.0])
+        wavelength = np.linspace(100.0, 3000.0, 1000)
+        reference  = module.attenuation(wavelength)
+        
+        # Keys are short whatever the size of the grid, and grids dropped from the store are stored again when they come back
+        key        = cigmod._wavelengthKey(wavelength)
+        self.assertEqual(len(key), 32)
+        
+        for shift in range(cigmod._STARBURST_GRIDS_SIZE + 1):
+            module.attenuation(wavelength + shift + 1)
+            
+        self.assertNotIn(key, cigmod._STARBURST_GRIDS)
+        np.testing.assert_array_equal(module.attenuation(wavelength), reference)
+        np.testing.assert_array_equal(module.attenuation(wavelength[::-1])[:, ::-1], reference)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+r"""
+.. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
+
+Tests of the filters module.
+"""
+
+import os
+import os.path          as     opath
+import tempfile
+import unittest
+import numpy            as     np
+from   astropy.io       import fits
+from   astropy.table    import MaskedColumn
+from   unittest         import mock
+
+import SED
+
+#: Directory with the example data
+DATADIR = opath.join(opath.dirname(opath.dirname(opath.abspath(__file__))), 'example', 'data')
+
+def _filterList(code: SED.SEDcode = SED.SEDcode.LEPHARE) -> SED.FilterList:
+    r'''Build a filter list from two bands of the example galaxy.'''
+    
+    with fits.open(opath.join(DATADIR, '1_mask.fits')) as hdul:
+        mask = hdul[0].data == 0
+    
+    filts    = [SED.Filter(band, *[opath.join(DATADIR, f'1_{band}{suffix}.fits') for suffix in ['', '_PSF2', '_var']], zpt, verbose=False)
+                for band, zpt in zip(['435', '606'], [25.68, 26.51])]
+    
+    return SED.FilterList(filts, mask, code=code, redshift=0.622)
+
+class TestGenTableCache(unittest.TestCase):
+    r'''Tests of the on-disk cache of :py:meth:`~.FilterList.genTable`.'''
+    
+    def assertSameTable(self, hit, miss):
+        r'''Check that two tables have the same columns, dtypes (in native byte order) and values, NaN pattern included.'''
+        
+        self.assertEqual(hit.colnames, miss.colnames)
+        
+        for name in miss.colnames:
+            with self.subTest(column=name):
+                self.assertNotIsInstance(hit[name], MaskedColumn)
+                self.assertEqual(hit[name].dtype, miss[name].dtype)
+                self.assertTrue(hit[name].dtype.isnative)
+                np.testing.assert_array_equal(np.asarray(hit[name]), np.asarray(miss[name]))
+    
+    def test_hit_equals_miss(self):
+        
+        for code in [SED.SEDcode.LEPHARE, SED.SEDcode.CIGALE]:
+            with self.subTest(code=code), tempfile.TemporaryDirectory() as cacheDir:
+                
+                flist   = _filterList(code=code)
+                factory = flist._LePhareTableFactory if code is SED.SEDcode.LEPHARE else flist._CigaleTableFactory
+                
+                def withNaN(*args, **kwargs):
+                    r'''Put NaN values in a data column so that their round trip through the cache is tested.'''
+                    
+                    columns, names, dtypes = factory(*args, **kwargs)
+                    columns[2]             = np.array(columns[2], dtype=float)
+                    columns[2][::7]        = np.nan
+                    return columns, names, dtypes
+                
+                with mock.patch.object(flist, factory.__name__, withNaN):
+                    miss = flist.genTable(texpFac=4, cacheDir=cacheDir).copy()
+                    
+                self.assertTrue(np.isnan(miss.columns[2]).any())
+                self.assertEqual(len(os.listdir(cacheDir)), 1)
+                
+                hit     = flist.genTable(texpFac=4, cacheDir=cacheDir)
+                self.assertSameTable(hit, miss)
+    
+    def test_user_directory_is_expanded(self):
+        
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as cwd, mock.patch.dict(os.environ, {'HOME': home}):
+            
+            oldCwd = os.getcwd()
+            os.chdir(cwd)
+            
+            try:
+                _filterList().genTable(texpFac=4, cacheDir=opath.join('~', '.cache', 'SED'))
+            finally:
+                os.chdir(oldCwd)
+                
+            self.assertEqual(len(os.listdir(opath.join(home, '.cache', 'SED'))), 1)
+            self.assertEqual(os.listdir(cwd), [])
+
+class TestFilterReader(unittest.TestCase):
+    r'''Tests of the bounding box handling when a reader function is given to :py:class:`~.Filter`.'''
+    
+    bbox = (10, 40, 20, 60)
+    
+    def _filter(self, reader):
+        r'''Build a filter of the example galaxy with the given reader and the test bounding box.'''
+        
+        return SED.Filter('435', opath.join(DATADIR, '1_435.fits'), None, opath.join(DATADIR, '1_435_var.fits'), 25.68, verbose=False, reader=reader, bbox=self.bbox)
+    
+    def test_bbox_is_passed_to_reader(self):
+        
+        calls = []
+        
+        def reader(file, ext=0, header=True, bbox=None):
+            calls.append(bbox)
+            ymin, ymax, xmin, xmax = bbox
+            
+            with fits.open(file) as hdul:
+                return hdul[ext].section[ymin:ymax, xmin:xmax], hdul[ext].header
+        
+        filt = self._filter(reader)
+        
+        self.assertEqual(calls, [self.bbox]*2)
+        self.assertEqual(filt.data.shape, (30, 40))
+    
+    def test_reader_without_bbox(self):
+        
+        def reader(file, ext=0, header=True):
+            return fits.getdata(file, ext, header=True)
+        
+        full = fits.getdata(opath.join(DATADIR, '1_435.fits'))
+        np.testing.assert_array_equal(self._filter(reader).data, full[10:40, 20:60])
+
+if __name__ == '__main__':
+    unittest.main()